@@ -113,4 +113,16 @@ describe('GridBoundaries', () => {
     expect(boundaries.hasBottomBound(2, 2)).toBe(true);
     expect(boundaries.hasRightBound(2, 2)).toBe(true);
   });
+
+  it('treats malformed, non-canonical and out-of-grid refs as uncovered cells', () => {
+    const tolerant = new GridBoundaries([
+      { cells: ['A1', 'A2'], value: 3 },
+      { cells: ['B1', 'b2', 'B0', 'bogus', 'C3'], value: 3 }
+    ], 2);
+    expect(tolerant.hasRightBound(1, 1)).toBe(true);
+    expect(tolerant.hasBottomBound(1, 1)).toBe(false);
+    // 'b2' does not mark B2, so B1 and B2 fall in different cages
+    expect(tolerant.hasBottomBound(1, 2)).toBe(true);
+    expect(tolerant.hasRightBound(2, 1)).toBe(true);
+  });
 });
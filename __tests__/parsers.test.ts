@@ -44,6 +44,38 @@ describe('parseCellRef', () => {
   it('throws for empty string', () => {
     expect(() => parseCellRef('')).toThrow('Bad cell ref');
   });
+
+  it('parses multi-digit rows', () => {
+    expect(parseCellRef('C12')).toEqual({ columnId: 3, rowId: 12 });
+    expect(parseCellRef('A10')).toEqual({ columnId: 1, rowId: 10 });
+  });
+
+  it('trims surrounding whitespace', () => {
+    expect(parseCellRef(' b3 ')).toEqual({ columnId: 2, rowId: 3 });
+  });
+
+  it('returns the same ref for every spelling of a cell', () => {
+    expect(parseCellRef(' b3 ')).toBe(parseCellRef('B3'));
+    expect(parseCellRef('Z99')).toEqual({ columnId: 26, rowId: 99 });
+  });
+
+  it('throws for a missing, zero or zero-padded row', () => {
+    expect(() => parseCellRef('A')).toThrow('Bad cell ref');
+    expect(() => parseCellRef('A0')).toThrow('Bad cell ref');
+    expect(() => parseCellRef('A01')).toThrow('Bad cell ref');
+  });
+
+  it('throws for refs not shaped letter-then-digits', () => {
+    expect(() => parseCellRef('1A')).toThrow('Bad cell ref');
+    expect(() => parseCellRef('A1x')).toThrow('Bad cell ref');
+    expect(() => parseCellRef('AB1')).toThrow('Bad cell ref');
+    expect(() => parseCellRef('A 1')).toThrow('Bad cell ref');
+  });
+
+  it('throws for characters just outside A-Z', () => {
+    expect(() => parseCellRef('@1')).toThrow('Bad cell ref');
+    expect(() => parseCellRef('[1')).toThrow('Bad cell ref');
+  });
 });
 
 describe('parseOperation', () => {
@@ -15,21 +15,41 @@ Requirements:
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import os
 import re
 import shutil
+import subprocess
 import sys
+import tempfile
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
 import cv2
 import numpy as np
 import yaml
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+
 try:
     import pytesseract
 except ImportError:
     pytesseract = None
 
+# Optional in-process Tesseract bindings: no process spawn or model load per call
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
 # Auto-detect Tesseract on Windows when not in PATH
 if pytesseract is not None and sys.platform == "win32" and not shutil.which("tesseract"):
     _WIN_PATHS = [
@@ -58,6 +78,7 @@ def _flow_representer(dumper: yaml.Dumper, data: _FlowList):
 
 
 yaml.add_representer(_FlowList, _flow_representer)
+yaml.add_representer(_FlowList, _flow_representer, Dumper=_YamlDumper)
 
 
 # ── helpers ─────────────────────────────────────────────────────────────────
@@ -94,7 +115,7 @@ def _find_grid_bbox(gray: np.ndarray) -> tuple[int, int, int, int]:
             cv2.getStructuringElement(cv2.MORPH_RECT, (1, min_len)),
         )
         combined = cv2.dilate(
-            cv2.add(h_lines, v_lines), np.ones((5, 5), np.uint8), iterations=2,
+            cv2.bitwise_or(h_lines, v_lines), np.ones((5, 5), np.uint8), iterations=2,
         )
         contours, _ = cv2.findContours(combined, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         best, best_area = None, 0
@@ -146,31 +167,27 @@ def _detect_line_positions(
     """Return candidate (h_positions, v_positions) of grid lines relative to grid origin."""
     crop = gray[gy:gy + gh, gx:gx + gw]
 
-    # Adaptive threshold catches both thin (gray) and thick (dark) lines
+    # Adaptive threshold catches both thin (gray) and thick (dark) lines.
+    # Dark pixels are set to 1 (not 255) so row/column sums are pixel counts.
     adaptive = cv2.adaptiveThreshold(
-        crop, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+        crop, 1, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
         cv2.THRESH_BINARY_INV, blockSize=15, C=5,
     )
-    _dbg_save("debug_adaptive.png", adaptive)
+    if _DEBUG:
+        _dbg_save("debug_adaptive.png", adaptive * 255)
 
     # Sum-projection: fraction of dark pixels per row / column
-    h_proj = np.sum(adaptive > 0, axis=1).astype(float) / gw
-    v_proj = np.sum(adaptive > 0, axis=0).astype(float) / gh
+    h_counts = cv2.reduce(adaptive, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel()
+    v_counts = cv2.reduce(adaptive, 0, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel()
+    h_proj = h_counts.astype(np.float32) / gw
+    v_proj = v_counts.astype(np.float32) / gh
 
     def find_peaks(proj: np.ndarray, threshold: float = 0.25) -> list[int]:
-        peaks: list[int] = []
-        in_run, start = False, 0
-        for i in range(len(proj)):
-            if proj[i] > threshold and not in_run:
-                start, in_run = i, True
-            elif proj[i] <= threshold and in_run:
-                seg = proj[start:i]
-                peaks.append(start + int(np.argmax(seg)))
-                in_run = False
-        if in_run:
-            seg = proj[start:]
-            peaks.append(start + int(np.argmax(seg)))
-        return peaks
+        # Runs above threshold start/end where the padded mask flips
+        mask = np.concatenate(([False], proj > threshold, [False]))
+        edges = np.flatnonzero(mask[1:] != mask[:-1])
+        return [int(start + np.argmax(proj[start:end]))
+                for start, end in zip(edges[::2], edges[1::2])]
 
     h_peaks = find_peaks(h_proj)
     v_peaks = find_peaks(v_proj)
@@ -202,25 +219,53 @@ def _detect_line_positions(
 
 # ── grid size selection ─────────────────────────────────────────────────────
 
-def _regularity_score(candidates: list[int], total: int, n: int) -> float:
-    """Score how well candidates fit a regular N-division grid. Lower = better."""
+def _nearest_candidates(
+    candidates: list[int], first: float, spacing: float, n: int,
+) -> tuple[list[float], list[float], list[int]]:
+    """For each of the n+1 evenly spaced positions, the nearest candidate.
+
+    Returns (expected positions, distances, candidate indices); ties go to the
+    earlier (smaller) candidate.
+    """
+    expected = first + np.arange(n + 1) * spacing
+    dists = np.abs(np.asarray(candidates)[None, :] - expected[:, None])
+    nearest = np.argmin(dists, axis=1)
+    min_dists = dists[np.arange(n + 1), nearest]
+    return expected.tolist(), min_dists.tolist(), nearest.tolist()
+
+
+# Grid sizes tried when the size is not given
+_GRID_SIZES = range(4, 10)
+
+
+def _regularity_scores(candidates: list[int], total: int, sizes: range) -> list[float]:
+    """Score how well candidates fit a regular N-division grid, for each N in sizes.
+
+    Lower = better.  Nearest-candidate distances for every size come from one
+    broadcast over (size, expected line, candidate).
+    """
     if len(candidates) < 2:
-        return float("inf")
+        return [float("inf")] * len(sizes)
     first, last = candidates[0], candidates[-1]
-    spacing = (last - first) / n
-    if spacing < 10:
-        return float("inf")
-
-    matched, error = 0, 0.0
-    for k in range(n + 1):
-        expected = first + k * spacing
-        min_dist = min(abs(c - expected) for c in candidates)
-        if min_dist < spacing * 0.20:
-            matched += 1
-            error += min_dist
-        else:
-            error += spacing * 0.5
-    return -matched * 1000 + error / (n + 1)
+    ns = np.array(sizes)
+    spacings = (last - first) / ns
+    expected = first + np.arange(ns.max() + 1)[None, :] * spacings[:, None]
+    dists = np.abs(np.asarray(candidates)[None, None, :] - expected[:, :, None]).min(axis=2)
+
+    scores: list[float] = []
+    for n, spacing, row in zip(sizes, spacings.tolist(), dists.tolist()):
+        if spacing < 10:
+            scores.append(float("inf"))
+            continue
+        matched, error = 0, 0.0
+        for min_dist in row[:n + 1]:
+            if min_dist < spacing * 0.20:
+                matched += 1
+                error += min_dist
+            else:
+                error += spacing * 0.5
+        scores.append(-matched * 1000 + error / (n + 1))
+    return scores
 
 
 def _fit_lines(candidates: list[int], total: int, n: int) -> list[int]:
@@ -231,11 +276,8 @@ def _fit_lines(candidates: list[int], total: int, n: int) -> list[int]:
     spacing = (last - first) / n
 
     result: list[int] = []
-    for k in range(n + 1):
-        expected = first + k * spacing
-        dists = [(abs(c - expected), c) for c in candidates]
-        min_dist, nearest = min(dists)
-        result.append(nearest if min_dist < spacing * 0.20 else int(round(expected)))
+    for expected, min_dist, i in zip(*_nearest_candidates(candidates, first, spacing, n)):
+        result.append(candidates[i] if min_dist < spacing * 0.20 else int(round(expected)))
     return result
 
 
@@ -247,9 +289,11 @@ def _detect_size_and_lines(
     if n is not None:
         return n, _fit_lines(h_cands, gh, n), _fit_lines(v_cands, gw, n)
 
+    h_scores = _regularity_scores(h_cands, gh, _GRID_SIZES)
+    v_scores = _regularity_scores(v_cands, gw, _GRID_SIZES)
     best_n, best_score = 4, float("inf")
-    for try_n in range(4, 10):
-        score = _regularity_score(h_cands, gh, try_n) + _regularity_score(v_cands, gw, try_n)
+    for try_n, h_score, v_score in zip(_GRID_SIZES, h_scores, v_scores):
+        score = h_score + v_score
         _dbg(f"  n={try_n}: score={score:.1f}")
         if score < best_score:
             best_score, best_n = score, try_n
@@ -260,6 +304,30 @@ def _detect_size_and_lines(
 
 # ── border classification ──────────────────────────────────────────────────
 
+def _percentile_10(strips: list[np.ndarray]) -> np.ndarray:
+    """np.percentile(strip, 10) of every strip, computed in one vectorized pass.
+
+    Strips differ slightly in size, so they are packed into rows padded with
+    255 (sorting puts the padding after the real pixels) and the 10th
+    percentile is interpolated per row exactly as np.percentile does.
+    """
+    sizes = np.array([strip.size for strip in strips])
+    packed = np.full((len(strips), sizes.max()), 255, dtype=np.uint8)
+    for i, strip in enumerate(strips):
+        packed[i, :strip.size] = strip.ravel()
+    packed.sort(axis=1)
+
+    virtual = (sizes - 1) * 0.1
+    lo = np.floor(virtual).astype(np.intp)
+    hi = np.minimum(lo + 1, sizes - 1)
+    gamma = virtual - lo
+    rows = np.arange(len(strips))
+    a = packed[rows, lo].astype(float)
+    b = packed[rows, hi].astype(float)
+    diff = b - a
+    return np.where(gamma >= 0.5, b - diff * (1 - gamma), a + diff * gamma)
+
+
 def _classify_borders(
     gray: np.ndarray,
     gx: int, gy: int,
@@ -281,64 +349,77 @@ def _classify_borders(
     margin_w = max(5, int(cell_w * 0.25))
     radius = max(2, int(min(cell_h, cell_w) * 0.02))
 
-    measurements: list[tuple[str, int, int, float]] = []
+    keys: list[tuple[str, int, int]] = []
+    strips: list[np.ndarray] = []
+
+    # Strip extents along each border line, shared by every line on that axis
+    col_spans = [(v_pos[c] + margin_w, v_pos[c + 1] - margin_w) for c in range(n)]
+    row_spans = [(h_pos[r] + margin_h, h_pos[r + 1] - margin_h) for r in range(n)]
 
     # Horizontal internal borders
     for r in range(1, n):
         y = h_pos[r]
         y0, y1 = max(0, y - radius), min(crop.shape[0], y + radius + 1)
-        for c in range(n):
-            x0, x1 = v_pos[c] + margin_w, v_pos[c + 1] - margin_w
+        for c, (x0, x1) in enumerate(col_spans):
             if x0 >= x1 or y0 >= y1:
                 continue
             strip = crop[y0:y1, x0:x1]
             if strip.size == 0:
                 continue
-            measurements.append(("h", r, c, 255.0 - float(np.percentile(strip, 10))))
+            keys.append(("h", r, c))
+            strips.append(strip)
 
     # Vertical internal borders
     for c in range(1, n):
         x = v_pos[c]
         x0, x1 = max(0, x - radius), min(crop.shape[1], x + radius + 1)
-        for r in range(n):
-            y0, y1 = h_pos[r] + margin_h, h_pos[r + 1] - margin_h
+        for r, (y0, y1) in enumerate(row_spans):
             if y0 >= y1 or x0 >= x1:
                 continue
             strip = crop[y0:y1, x0:x1]
             if strip.size == 0:
                 continue
-            measurements.append(("v", r, c, 255.0 - float(np.percentile(strip, 10))))
+            keys.append(("v", r, c))
+            strips.append(strip)
 
-    if not measurements:
+    if not strips:
         return {}, {}
 
+    # Darkness per border, parallel to keys
+    values = 255.0 - _percentile_10(strips)
+
     # Two-class separation (Otsu on mean darkness values)
-    values = np.array([v for *_, v in measurements])
     _dbg(f"Border darkness: min={np.min(values):.1f} max={np.max(values):.1f} "
          f"median={np.median(values):.1f}")
 
-    sorted_v = np.sort(np.unique(values))
-    best_thresh, best_var = float(np.median(values)), -1.0
-    for t in sorted_v:
-        lo, hi = values[values <= t], values[values > t]
-        if len(lo) == 0 or len(hi) == 0:
-            continue
-        var = len(lo) * len(hi) * (np.mean(hi) - np.mean(lo)) ** 2
-        if var > best_var:
-            best_var, best_thresh = var, float(t)
+    # Between-class variance of splitting at each distinct value, from
+    # prefix sums of the sorted values (the largest value leaves no upper class)
+    sorted_v = np.sort(values)
+    splits = np.unique(sorted_v)[:-1]
+    if len(splits) == 0:
+        best_thresh = float(np.median(values))
+    else:
+        total = len(sorted_v)
+        n_lo = np.searchsorted(sorted_v, splits, side="right")
+        prefix = np.cumsum(sorted_v)
+        sum_lo = prefix[n_lo - 1]
+        mean_lo = sum_lo / n_lo
+        mean_hi = (prefix[-1] - sum_lo) / (total - n_lo)
+        between = n_lo * (total - n_lo) * (mean_hi - mean_lo) ** 2
+        best_thresh = float(splits[np.argmax(between)])
 
     best_thresh = max(best_thresh, 3.0)
     _dbg(f"Border threshold: {best_thresh:.1f}")
 
+    thick = (values > best_thresh).tolist()
     h_thick: dict[tuple[int, int], bool] = {}
     v_thick: dict[tuple[int, int], bool] = {}
-    for axis, r, c, score in measurements:
-        is_thick = score > best_thresh
+    for (axis, r, c), is_thick in zip(keys, thick):
         (h_thick if axis == "h" else v_thick)[(r, c)] = is_thick
 
     if _DEBUG:
-        for axis, r, c, score in measurements:
-            tag = "THICK" if score > best_thresh else "thin "
+        for (axis, r, c), score, is_thick in zip(keys, values, thick):
+            tag = "THICK" if is_thick else "thin "
             _dbg(f"  {axis}({r},{c}): {score:.3f} {tag}")
 
     return h_thick, v_thick
@@ -351,41 +432,56 @@ def _group_cages(
     h_thick: dict[tuple[int, int], bool],
     v_thick: dict[tuple[int, int], bool],
 ) -> list[list[tuple[int, int]]]:
-    parent: dict[tuple[int, int], tuple[int, int]] = {
-        (r, c): (r, c) for r in range(n) for c in range(n)
-    }
+    # Cells are flattened to r * n + c so the parent table is a plain int list
+    parent = list(range(n * n))
 
-    def find(x: tuple[int, int]) -> tuple[int, int]:
+    def find(x: int) -> int:
         while parent[x] != x:
             parent[x] = parent[parent[x]]
             x = parent[x]
         return x
 
-    def union(a: tuple[int, int], b: tuple[int, int]) -> None:
+    def union(a: int, b: int) -> None:
         ra, rb = find(a), find(b)
         if ra != rb:
             parent[rb] = ra
 
     for r in range(n):
         for c in range(n):
+            i = r * n + c
             if c + 1 < n and not v_thick.get((r, c + 1), True):
-                union((r, c), (r, c + 1))
+                union(i, i + 1)
             if r + 1 < n and not h_thick.get((r + 1, c), True):
-                union((r, c), (r + 1, c))
+                union(i, i + n)
 
-    groups: dict[tuple[int, int], list[tuple[int, int]]] = {}
+    groups: dict[int, list[tuple[int, int]]] = {}
     for r in range(n):
         for c in range(n):
-            groups.setdefault(find((r, c)), []).append((r, c))
+            groups.setdefault(find(r * n + c), []).append((r, c))
     return [sorted(cells) for cells in groups.values()]
 
 
 # ── label OCR ──────────────────────────────────────────────────────────────
 
-_LABEL_RE = re.compile(r"^(\d[\d,]*)([+\-x×÷/?])?$")
+_LABEL_RE = re.compile(r"(\d[\d,]*)([+\-x×÷/?])?")
+# Digits followed by one unrecognized character that may be an operator
+_TRAILING_OP_RE = re.compile(r"(\d+)(.)")
+# Leading value of a label that does not fully parse
+_DIGITS_RE = re.compile(r"[\d,]+")
+
+# Cleanup of raw label OCR: drop whitespace, normalize operator glyphs and
+# letters Tesseract confuses with digits
+_OCR_TRANS = str.maketrans({
+    " ": "", "\n": "",
+    "×": "x", "÷": "/", "−": "-", "X": "x",
+    "O": "0", "o": "0", "Q": "0",
+    "l": "1", "I": "1",
+})
 
 
 def _require_tesseract() -> None:
+    if tesserocr is not None:
+        return
     if pytesseract is None:
         print(
             "Error: pytesseract not installed.\n"
@@ -405,6 +501,12 @@ def _require_tesseract() -> None:
         raise SystemExit(1)
 
 
+def _dark_run(fill: np.ndarray) -> int:
+    """Number of leading entries of fill that are more than 90% dark."""
+    light = np.flatnonzero(fill <= 0.90)
+    return int(light[0]) if len(light) else len(fill)
+
+
 def _trim_to_text(crop_gray: np.ndarray) -> np.ndarray:
     """Remove border artifacts and crop tightly around label text."""
     h, w = crop_gray.shape
@@ -416,24 +518,11 @@ def _trim_to_text(crop_gray: np.ndarray) -> np.ndarray:
     #    remnants).  Only strip if the column/row is >90% dark across its
     #    full extent — ensures we only remove solid border lines, not text.
     max_strip = min(w, h) // 6  # never strip more than ~16% of the crop
-    left = 0
-    for c in range(min(max_strip, w)):
-        if np.mean(binary[:, c] > 0) > 0.90:
-            left = c + 1
-        else:
-            break
-    top = 0
-    for r in range(min(max_strip, h)):
-        if np.mean(binary[r, :] > 0) > 0.90:
-            top = r + 1
-        else:
-            break
-    right = w
-    for c in range(w - 1, max(w - max_strip - 1, -1), -1):
-        if np.mean(binary[:, c] > 0) > 0.90:
-            right = c
-        else:
-            break
+    col_fill = np.count_nonzero(binary, axis=0) / h
+    row_fill = np.count_nonzero(binary, axis=1) / w
+    left = _dark_run(col_fill[:max_strip])
+    top = _dark_run(row_fill[:max_strip])
+    right = w - _dark_run(col_fill[::-1][:max_strip])
     if left > 0 or top > 0 or right < w:
         _dbg(f"  Stripped border: left={left}px top={top}px right={w - right}px")
         crop_gray = crop_gray[top:, left:right]
@@ -442,37 +531,26 @@ def _trim_to_text(crop_gray: np.ndarray) -> np.ndarray:
         if h < 5 or w < 5:
             return crop_gray
 
-    # 3. Pad so contours touching the edge are properly detected
-    bp = 2
-    padded = cv2.copyMakeBorder(binary, bp, bp, bp, bp,
-                                cv2.BORDER_CONSTANT, value=0)
-    contours, _ = cv2.findContours(padded, cv2.RETR_EXTERNAL,
-                                   cv2.CHAIN_APPROX_SIMPLE)
-    if not contours:
+    # 3. Bounding boxes of all dark components in one call
+    num, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+    if num <= 1:
         return crop_gray
+    x, y, cw, ch = stats[1:, :cv2.CC_STAT_AREA].T
 
-    # 5. Keep contours that look like text (not thin border lines)
+    # 4. Keep components that look like text (not thin border lines)
     # Must balance filtering border artifacts vs keeping small operators (-, +)
     min_area = max(5, int(w * h * 0.002))  # scale threshold with crop size
-    text_cnts: list[np.ndarray] = []
-    for cnt in contours:
-        x, y, cw, ch = cv2.boundingRect(cnt)
-        if cw * ch < min_area:
-            continue
-        aspect = min(cw, ch) / max(cw, ch) if max(cw, ch) > 0 else 0
-        # Allow thin horizontal strokes (potential minus signs) if not too thin
-        # Border artifacts span full height/width; operators are short
-        is_short_horizontal = cw > ch * 2 and cw < w * 0.7 and ch < h * 0.3
-        if aspect < 0.08 and not is_short_horizontal:
-            continue
-        text_cnts.append(cnt)
-
-    if not text_cnts:
+    aspect = np.minimum(cw, ch) / np.maximum(cw, ch)
+    # Allow thin horizontal strokes (potential minus signs) if not too thin
+    # Border artifacts span full height/width; operators are short
+    is_short_horizontal = (cw > ch * 2) & (cw < w * 0.7) & (ch < h * 0.3)
+    keep = (cw * ch >= min_area) & ((aspect >= 0.08) | is_short_horizontal)
+    if not keep.any():
         return crop_gray
 
-    all_pts = np.vstack(text_cnts)
-    bx, by, tw, th = cv2.boundingRect(all_pts)
-    bx, by = bx - bp, by - bp
+    bx, by = int(x[keep].min()), int(y[keep].min())
+    tw = int((x + cw)[keep].max()) - bx
+    th = int((y + ch)[keep].max()) - by
     pad = 3
     bx, by = max(0, bx - pad), max(0, by - pad)
     tw = min(w - bx, tw + 2 * pad)
@@ -490,7 +568,8 @@ def _prepare_ocr_image(crop_gray: np.ndarray) -> np.ndarray:
 
     _, binary = cv2.threshold(crop_gray, 0, 255,
                               cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-    if np.mean(binary) < 128:
+    # Mostly dark (mean below 128) means light text on a dark background
+    if cv2.countNonZero(binary) * 255 < 128 * binary.size:
         binary = 255 - binary
 
     pad = 12
@@ -498,33 +577,183 @@ def _prepare_ocr_image(crop_gray: np.ndarray) -> np.ndarray:
                               cv2.BORDER_CONSTANT, value=255)
 
 
-def _run_tesseract(padded: np.ndarray, configs: list[str]) -> str:
-    """Try multiple Tesseract configs, pick best result via voting.
+@functools.lru_cache(maxsize=None)
+def _parse_tesseract_config(cfg: str) -> tuple[int, int, dict[str, str]]:
+    """Split a Tesseract CLI config string into (oem, psm, -c variables)."""
+    oem, psm = 3, 3  # Tesseract CLI defaults
+    variables: dict[str, str] = {}
+    tokens = iter(cfg.split())
+    for token in tokens:
+        if token == "--oem":
+            oem = int(next(tokens))
+        elif token == "--psm":
+            psm = int(next(tokens))
+        elif token == "-c":
+            key, _, value = next(tokens).partition("=")
+            variables[key] = value
+    return oem, psm, variables
+
+
+# Idle tesserocr instances per OCR engine mode.  Each holds a loaded model and
+# serves one thread at a time, so they are checked out rather than shared.
+_TESSEROCR_IDLE: dict[int, list] = {}
+_TESSEROCR_LOCK = threading.Lock()
+
+
+@contextmanager
+def _tesserocr_api(oem: int) -> Iterator:
+    with _TESSEROCR_LOCK:
+        idle = _TESSEROCR_IDLE.setdefault(oem, [])
+        api = idle.pop() if idle else None
+    if api is None:
+        api = tesserocr.PyTessBaseAPI(oem=oem)
+    try:
+        yield api
+    finally:
+        with _TESSEROCR_LOCK:
+            _TESSEROCR_IDLE[oem].append(api)
+
+
+def _tesserocr_text(padded: np.ndarray, cfg: str) -> str:
+    """Run one config on a grayscale image through tesserocr."""
+    oem, psm, variables = _parse_tesseract_config(cfg)
+    h, w = padded.shape
+    with _tesserocr_api(oem) as api:
+        api.SetPageSegMode(psm)
+        # The instance is reused across configs, so always reset the whitelist
+        api.SetVariable("tessedit_char_whitelist", variables.get("tessedit_char_whitelist", ""))
+        for key, value in variables.items():
+            api.SetVariable(key, value)
+        api.SetImageBytes(np.ascontiguousarray(padded).tobytes(), w, h, 1, w)
+        return api.GetUTF8Text()
+
+
+def _tesseract_texts(padded: np.ndarray, configs: list[str]) -> list[str]:
+    """Raw Tesseract output for each config; configs that fail are skipped."""
+    texts: list[str] = []
+    for cfg in configs:
+        try:
+            if tesserocr is not None:
+                texts.append(_tesserocr_text(padded, cfg))
+            else:
+                texts.append(pytesseract.image_to_string(padded, config=cfg))
+        except Exception:
+            continue
+    return texts
+
+
+# Long list files have been seen to hang Tesseract, so batches are capped
+_TESSERACT_BATCH_SIZE = 50
+
+# Concurrent Tesseract processes; each is limited to one thread (see _run_tesseract)
+_OCR_WORKERS = os.cpu_count() or 1
+
+
+def _run_tesseract(input_file: Path, out_base: Path, cfg: str) -> None:
+    """Run the Tesseract CLI as pytesseract does, writing out_base.txt.
+
+    Several run in parallel, so unless the environment already sets a limit,
+    each child is kept from also spawning a thread per core.
+    """
+    subprocess.run(
+        [pytesseract.pytesseract.tesseract_cmd, str(input_file), str(out_base),
+         *cfg.split(), "txt"],
+        env={"OMP_THREAD_LIMIT": "1", **os.environ},
+        stdin=subprocess.DEVNULL, capture_output=True, check=True,
+    )
+
+
+def _tesseract_texts_batch(
+    images: list[np.ndarray], configs: list[str],
+) -> list[list[str]]:
+    """Raw Tesseract output per image per config, with one Tesseract run per config.
+
+    The images are written to a scratch directory and passed to Tesseract as
+    a list file. Each config then pays process start-up and model loading
+    once for the whole batch rather than once per image. The output is split
+    into pages on the form feed that Tesseract 5 writes between pages
+    (Tesseract 4 also ends the last page with one). If the page count does
+    not match, a warning is printed and that config falls back to one call
+    per image.
+
+    With tesserocr there is no start-up cost to amortize, so the images are
+    read in-process on the worker pool instead.
+    """
+    if tesserocr is not None:
+        with ThreadPoolExecutor(max_workers=_OCR_WORKERS) as pool:
+            return list(pool.map(_tesseract_texts, images, [configs] * len(images)))
+
+    texts: list[list[str]] = [[] for _ in images]
+    with tempfile.TemporaryDirectory(prefix="mathdoku_ocr_") as tmp:
+        tmp_dir = Path(tmp)
+        paths: list[Path] = []
+        for i, img in enumerate(images):
+            path = tmp_dir / f"label_{i}.png"
+            cv2.imwrite(str(path), img)
+            paths.append(path)
+
+        def _run_batch(list_file: Path, cfg_idx: int, count: int) -> list[str]:
+            out_base = tmp_dir / f"{list_file.stem}_cfg{cfg_idx}"
+            try:
+                _run_tesseract(list_file, out_base, configs[cfg_idx])
+                pages = out_base.with_suffix(".txt").read_text(encoding="utf-8").split("\f")
+            except Exception:
+                return []
+            if len(pages) == count + 1 and not pages[-1].strip():
+                pages.pop()
+            return pages
+
+        chunks: list[tuple[int, int, Path]] = []
+        for start in range(0, len(images), _TESSERACT_BATCH_SIZE):
+            end = min(start + _TESSERACT_BATCH_SIZE, len(images))
+            list_file = tmp_dir / f"batch_{start}.txt"
+            list_file.write_text("".join(f"{path}\n" for path in paths[start:end]),
+                                 encoding="utf-8")
+            chunks.append((start, end, list_file))
+
+        # Every (chunk, config) run goes on the pool at once, so a long batch
+        # read with few configs still keeps all workers busy
+        with ThreadPoolExecutor(max_workers=_OCR_WORKERS) as pool:
+            runs = {
+                (start, cfg_idx): pool.submit(_run_batch, list_file, cfg_idx, end - start)
+                for start, end, list_file in chunks
+                for cfg_idx in range(len(configs))
+            }
+            for start, end, _ in chunks:
+                for cfg_idx, cfg in enumerate(configs):
+                    pages = runs[start, cfg_idx].result()
+                    if len(pages) != end - start:
+                        print(f"Warning: batched Tesseract returned {len(pages)} pages for "
+                              f"{end - start} images with config {cfg!r}; "
+                              f"reading them one at a time",
+                              file=sys.stderr)
+                        for i in range(start, end):
+                            texts[i].extend(_tesseract_texts(images[i], [cfg]))
+                        continue
+                    for i in range(start, end):
+                        texts[i].append(pages[i - start])
+    return texts
+
+
+def _pick_label(texts: list[str]) -> str:
+    """Clean raw Tesseract outputs from several configs, pick best result via voting.
 
     Strategy: prefer longest digit string (avoids '11+' being outvoted by '1+'),
     then majority vote among those, then include operator if any matching result
     has one (catches operators missed by some configs).
     """
-    from collections import Counter
     results: list[tuple[str, str | None]] = []  # (digits, op_or_None)
     best_raw = ""
     raw_texts: list[str] = []  # for debugging
-    for cfg in configs:
-        try:
-            text = pytesseract.image_to_string(padded, config=cfg).strip()
-        except Exception:
-            continue
-        text = text.replace(" ", "").replace("\n", "")
-        text = text.replace("×", "x").replace("÷", "/").replace("−", "-")
-        text = text.replace("X", "x")
-        text = text.replace("O", "0").replace("o", "0").replace("Q", "0")
-        text = text.replace("l", "1").replace("I", "1")
+    for text in texts:
+        text = text.strip()
+        text = text.translate(_OCR_TRANS)
         text = text.rstrip(".,;:'\"")
         raw_texts.append(text)
-        m = _LABEL_RE.match(text)
+        m = _LABEL_RE.fullmatch(text)
         if not m:
             # Try to salvage trailing operator from garbled/unknown characters
-            m_raw = re.match(r"^(\d+)(.)$", text)
+            m_raw = _TRAILING_OP_RE.fullmatch(text)
             if m_raw and not m_raw.group(2).isdigit():
                 ch = m_raw.group(2)
                 # Dash variants: hyphen-minus, minus sign, en-dash, em-dash,
@@ -538,7 +767,7 @@ def _run_tesseract(padded: np.ndarray, configs: list[str]) -> str:
                 else:
                     # Unknown operator - mark with ? for manual review
                     text = m_raw.group(1) + "?"
-                m = _LABEL_RE.match(text)
+                m = _LABEL_RE.fullmatch(text)
         if m:
             results.append((m.group(1), m.group(2)))
         elif len(text) > len(best_raw):
@@ -607,6 +836,19 @@ def _run_tesseract(padded: np.ndarray, configs: list[str]) -> str:
     return best_digits
 
 
+# Voted label per prepared image and config set.  Retry crops overlap, so
+# they often binarize to an image that was already read.  Each
+# _read_cage_labels call keeps its own cache.
+_LabelCache = dict[tuple[bytes, tuple[int, ...], tuple[str, ...]], str]
+
+
+def _label_cache_key(
+    padded: np.ndarray, configs: list[str],
+) -> tuple[bytes, tuple[int, ...], tuple[str, ...]]:
+    digest = hashlib.blake2b(padded.tobytes(), digest_size=16).digest()
+    return digest, padded.shape, tuple(configs)
+
+
 _OCR_CONFIGS = [
     "--oem 1 --psm 7 -c tessedit_char_whitelist=0123456789+x-/,",
     "--oem 1 --psm 8 -c tessedit_char_whitelist=0123456789+x-/,",
@@ -618,26 +860,36 @@ _OCR_CONFIGS = [
     "--psm 8",
 ]
 
+# Single-cell cages are labeled with one digit and never an operator, so a few
+# digit-only configs are enough to vote on them
+_DIGIT_CONFIGS = [
+    "--oem 1 --psm 7 -c tessedit_char_whitelist=0123456789",
+    "--oem 1 --psm 8 -c tessedit_char_whitelist=0123456789",
+    "--oem 1 --psm 10 -c tessedit_char_whitelist=0123456789",
+]
+
 
-def _ocr_crop(crop_gray: np.ndarray) -> str:
-    """OCR a small grayscale crop. Returns cleaned text."""
+def _prepare_label_crop(crop_gray: np.ndarray) -> np.ndarray | None:
+    """Trim and binarize a label crop for Tesseract; None if too small to read."""
     h, w = crop_gray.shape
     if h < 10 or w < 10:
-        return ""
+        return None
 
     # Trim to text area (removes border line artifacts)
     trimmed = _trim_to_text(crop_gray)
     th, tw = trimmed.shape
     if th < 5 or tw < 5:
-        return ""
+        return None
+
+    return _prepare_ocr_image(trimmed)
 
-    padded = _prepare_ocr_image(trimmed)
-    result = _run_tesseract(padded, _OCR_CONFIGS)
 
+def _fix_zero_value(result: str) -> str:
+    """Correct an OCR'd label whose value reads as "0"."""
     # Cage value "0" is never valid in Mathdoku (all values are positive).
     # The most common OCR confusion is "9" → "0" due to similar shapes.
     # Replace "0" with "9" as a post-processing correction.
-    m = _LABEL_RE.match(result)
+    m = _LABEL_RE.fullmatch(result)
     if m and m.group(1) == "0":
         op_suffix = m.group(2) or ""
         _dbg(f"  Correcting invalid value '0' -> '9' (likely 9→0 OCR confusion)")
@@ -646,6 +898,28 @@ def _ocr_crop(crop_gray: np.ndarray) -> str:
     return result
 
 
+def _ocr_crops(
+    crops: list[np.ndarray], cache: _LabelCache, configs: list[str] = _OCR_CONFIGS,
+) -> list[str]:
+    """OCR small grayscale crops in one Tesseract batch. Returns cleaned text per crop.
+
+    Images already in cache, or repeated within the batch, are only read
+    once; new votes are added to cache.
+    """
+    keys = []
+    pending: dict[tuple[bytes, tuple[int, ...], tuple[str, ...]], np.ndarray] = {}
+    for crop in crops:
+        padded = _prepare_label_crop(crop)
+        key = None if padded is None else _label_cache_key(padded, configs)
+        if key is not None and key not in cache:
+            pending.setdefault(key, padded)
+        keys.append(key)
+    if pending:
+        for key, texts in zip(pending, _tesseract_texts_batch(list(pending.values()), configs)):
+            cache[key] = _pick_label(texts)
+    return ["" if key is None else _fix_zero_value(cache[key]) for key in keys]
+
+
 def _extract_label_crop(
     gray: np.ndarray, grid_up: np.ndarray | None,
     gx: int, gy: int, upscale: int,
@@ -671,11 +945,15 @@ def _extract_label_crop(
     return crop
 
 
-def _detect_trailing_operator(crop_gray: np.ndarray) -> str | None:
-    """Detect an operator character (+, -, x, /) at the right end of a label crop.
+def _isolate_trailing_operator(
+    crop_gray: np.ndarray,
+) -> tuple[np.ndarray, str | None] | None:
+    """Isolate an operator character (+, -, x, /) at the right end of a label crop.
 
-    Uses connected-component analysis to isolate the rightmost glyph,
-    then classifies it by shape and single-character OCR (PSM 10).
+    Uses connected-component analysis to isolate the rightmost glyph.
+    Returns the glyph prepared for single-character OCR (PSM 10) together
+    with a shape-based guess to fall back on, or None if no glyph there
+    looks like an operator.
     """
     trimmed = _trim_to_text(crop_gray)
     h, w = trimmed.shape
@@ -687,15 +965,19 @@ def _detect_trailing_operator(crop_gray: np.ndarray) -> str | None:
     bp = 2
     padded = cv2.copyMakeBorder(binary, bp, bp, bp, bp,
                                 cv2.BORDER_CONSTANT, value=0)
-    contours, _ = cv2.findContours(padded, cv2.RETR_EXTERNAL,
-                                   cv2.CHAIN_APPROX_SIMPLE)
-    if len(contours) < 2:
+    # Fill holes first so specks inside a digit's loop merge into it, the way
+    # findContours(RETR_EXTERNAL) would ignore them.  The padding makes (0, 0)
+    # part of the outer background.
+    outer = padded.copy()
+    cv2.floodFill(outer, None, (0, 0), 255)
+    filled = padded | cv2.bitwise_not(outer)
+    num, _, stats, _ = cv2.connectedComponentsWithStats(filled, connectivity=8)
+    if num < 3:  # background plus at least two glyphs
         return None
+    glyphs = stats[1:]
 
-    # Sort contours left-to-right by bounding-rect x
-    sorted_cnts = sorted(contours, key=lambda c: cv2.boundingRect(c)[0])
-    last = sorted_cnts[-1]
-    lx, ly, lw, lh_c = cv2.boundingRect(last)
+    # Rightmost glyph by bounding-box x
+    lx, ly, lw, lh_c = (int(v) for v in glyphs[np.argmax(glyphs[:, cv2.CC_STAT_LEFT]), :4])
 
     # Must be in the right portion of the crop (after digits)
     if lx < w * 0.35:
@@ -722,31 +1004,8 @@ def _detect_trailing_operator(crop_gray: np.ndarray) -> str | None:
                              interpolation=cv2.INTER_CUBIC)
     op_prepared = _prepare_ocr_image(op_crop)
 
-    # Try PSM 10 (single character) with operator-only whitelist
-    _OP_CONFIGS = [
-        "--psm 10 -c tessedit_char_whitelist=+-x/",
-        "--oem 1 --psm 10 -c tessedit_char_whitelist=+-x/",
-        "--psm 13 -c tessedit_char_whitelist=+-x/",
-        "--oem 1 --psm 13 -c tessedit_char_whitelist=+-x/",
-        "--psm 10",
-        "--psm 13",
-    ]
-    from collections import Counter
-    votes: list[str] = []
-    for cfg in _OP_CONFIGS:
-        try:
-            text = pytesseract.image_to_string(op_prepared, config=cfg).strip()
-        except Exception:
-            continue
-        text = text.replace("×", "x").replace("÷", "/").replace("−", "-")
-        if len(text) == 1 and text in {"+", "-", "x", "/"}:
-            votes.append(text)
-    if votes:
-        best_op = Counter(votes).most_common(1)[0][0]
-        _dbg(f"  Operator detection votes: {votes} -> {best_op}")
-        return best_op
-
-    # Fallback: shape-based classification
+    # Shape-based classification, used if OCR finds no operator
+    shape_op: str | None = None
     aspect = lw / lh_c if lh_c > 0 else 0
     if 0.6 < aspect < 1.6:
         # Near-square: likely '+' or 'x'
@@ -760,12 +1019,42 @@ def _detect_trailing_operator(crop_gray: np.ndarray) -> str | None:
         v_fill = np.mean(v_strip > 0) if v_strip.size > 0 else 0
         if h_fill > 0.5 and v_fill > 0.5:
             _dbg(f"  Shape-based: cross detected (h={h_fill:.2f} v={v_fill:.2f})")
-            return "+"
+            shape_op = "+"
     elif aspect > 2.0:
         # Wide and short: likely '-'
-        return "-"
+        shape_op = "-"
 
-    return None
+    return op_prepared, shape_op
+
+
+# Single-character configs for an isolated operator glyph
+_OP_CONFIGS = [
+    "--psm 10 -c tessedit_char_whitelist=+-x/",
+    "--oem 1 --psm 10 -c tessedit_char_whitelist=+-x/",
+    "--psm 13 -c tessedit_char_whitelist=+-x/",
+    "--oem 1 --psm 13 -c tessedit_char_whitelist=+-x/",
+    "--psm 10",
+    "--psm 13",
+]
+
+
+# Unicode operator glyphs in single-character operator reads
+_OP_TRANS = str.maketrans("×÷−", "x/-")
+
+
+def _vote_operator(texts: list[str]) -> str | None:
+    """Majority operator among raw single-character Tesseract outputs."""
+    votes: list[str] = []
+    for text in texts:
+        text = text.strip()
+        text = text.translate(_OP_TRANS)
+        if len(text) == 1 and text in {"+", "-", "x", "/"}:
+            votes.append(text)
+    if not votes:
+        return None
+    best_op = Counter(votes).most_common(1)[0][0]
+    _dbg(f"  Operator detection votes: {votes} -> {best_op}")
+    return best_op
 
 
 # ── mathematical validation ──────────────────────────────────────────────
@@ -883,6 +1172,7 @@ def _read_cage_labels(
 ) -> list[tuple[str, str | None]]:
     """For each cage, read and parse its label. Returns [(value, op), ...]."""
     _require_tesseract()
+    label_cache: _LabelCache = {}
 
     # If cells are small, pre-upscale the grid region for better OCR accuracy.
     # Extracting tiny 15px-tall crops leads to heavy per-crop upscaling with
@@ -904,7 +1194,9 @@ def _read_cage_labels(
         grid_up = None
         upscale = 1
 
-    results: list[tuple[str, str | None]] = []
+    # First read of every label, OCR'd together as a single Tesseract batch
+    label_crops: list[tuple[int, int, int, int, int, np.ndarray]] = []
+    s = upscale
     for idx, cells in enumerate(cages):
         tl_r, tl_c = cells[0]
         cx, cy = v_pos[tl_c], h_pos[tl_r]
@@ -913,7 +1205,6 @@ def _read_cage_labels(
 
         if grid_up is not None:
             # Use upscaled grid for crop extraction
-            s = upscale
             cw_s, ch_s = cw * s, ch * s
             margin = max(3, int(min(cw_s, ch_s) * 0.03))
             lx = int(cx * s) + margin
@@ -928,22 +1219,46 @@ def _read_cage_labels(
             lw = int(cw * 0.92)
             lh = int(ch * 0.42)
             crop = gray[ly:ly + lh, lx:lx + lw]
-
-        if crop.size == 0:
-            results.append(("?", None))
-            continue
-
-        _dbg_save(f"debug_label_{idx}.png", crop)
-
-        raw = _ocr_crop(crop)
-
-        # If first attempt failed, didn't match, or produced a suspicious
-        # value, retry with wider margins to avoid border artifacts bleeding
-        # into the crop.  Suspicious values:
-        #  - all-zero digits (no Mathdoku cage has value 0)
-        #  - single digit for a multi-cell cage (a digit may be cut off by
-        #    the thick cage border)
-        m_raw = _LABEL_RE.match(raw)
+        label_crops.append((cx, cy, lw, lh, margin, crop))
+        if crop.size > 0:
+            _dbg_save(f"debug_label_{idx}.png", crop)
+
+    def _read_retries(
+        retries: list[tuple[int, list[tuple[int, int, np.ndarray]]]],
+        configs: list[str] = _OCR_CONFIGS,
+    ) -> list[tuple[int, list[tuple[int, int, str]]]]:
+        """OCR the (scale, margin, crop) retries of every queued cage in one batch.
+
+        Every crop is read, not just those up to the first acceptable one, so
+        that the whole pass pays Tesseract start-up once; callers still take
+        the first reading they accept, in retry order.
+        """
+        texts = iter(_ocr_crops(
+            [crop for _, crops in retries for *_, crop in crops], label_cache, configs,
+        ))
+        return [(idx, [(k, m, next(texts)) for k, m, _ in crops]) for idx, crops in retries]
+
+    raws: list[str | None] = [None] * len(cages)
+    readable = [i for i, (*_, crop) in enumerate(label_crops) if crop.size > 0]
+    for group, configs in (
+        ([i for i in readable if len(cages[i]) == 1], _DIGIT_CONFIGS),
+        ([i for i in readable if len(cages[i]) > 1], _OCR_CONFIGS),
+    ):
+        reads = _ocr_crops([label_crops[i][-1] for i in group], label_cache, configs)
+        for i, raw in zip(group, reads):
+            raws[i] = raw
+
+    # If first attempt failed, didn't match, or produced a suspicious
+    # value, retry with wider margins to avoid border artifacts bleeding
+    # into the crop.  Suspicious values:
+    #  - all-zero digits (no Mathdoku cage has value 0)
+    #  - single digit for a multi-cell cage (a digit may be cut off by
+    #    the thick cage border)
+    doubts: dict[int, tuple[bool, str, bool, bool]] = {}
+    margin_retries: list[tuple[int, list[tuple[int, int, np.ndarray]]]] = []
+    for idx in readable:
+        cells, raw = cages[idx], raws[idx]
+        m_raw = _LABEL_RE.fullmatch(raw)
         raw_digits = m_raw.group(1) if m_raw else ""
         is_zero_val = m_raw is not None and raw_digits.lstrip("0") == ""
         is_short_for_cage = m_raw is not None and (
@@ -951,52 +1266,101 @@ def _read_cage_labels(
             or (len(raw_digits) == 2 and len(cells) > 2)  # 2-digit for 3+ cells
         )
         needs_retry = not m_raw or is_zero_val or is_short_for_cage
-        if needs_retry:
-            for margin2 in (margin * 2, margin * 3, margin * 4):
-                if grid_up is not None:
-                    lx2 = int(cx * s) + margin2
-                    ly2 = int(cy * s) + margin2
-                    crop2 = grid_up[ly2:ly2 + lh, lx2:lx2 + lw]
-                else:
-                    lx2 = gx + cx + margin2
-                    ly2 = gy + cy + margin2
-                    crop2 = gray[ly2:ly2 + lh, lx2:lx2 + lw]
-                if crop2.size == 0 or crop2.shape[0] < 5 or crop2.shape[1] < 5:
-                    continue
-                raw2 = _ocr_crop(crop2)
-                m2 = _LABEL_RE.match(raw2)
+        if not needs_retry:
+            continue
+        doubts[idx] = (m_raw is not None, raw_digits, is_zero_val, is_short_for_cage)
+
+        # Only the margin changes between retries
+        cx, cy, lw, lh, margin, _ = label_crops[idx]
+        if grid_up is not None:
+            src, left, top = grid_up, int(cx * s), int(cy * s)
+        else:
+            src, left, top = gray, gx + cx, gy + cy
+        crops: list[tuple[int, int, np.ndarray]] = []
+        for margin2 in (margin * 2, margin * 3, margin * 4):
+            lx2 = left + margin2
+            ly2 = top + margin2
+            crop2 = src[ly2:ly2 + lh, lx2:lx2 + lw]
+            if crop2.size == 0 or crop2.shape[0] < 5 or crop2.shape[1] < 5:
+                continue
+            crops.append((s, margin2, crop2))
+        margin_retries.append((idx, crops))
+
+    for configs, group in (
+        (_DIGIT_CONFIGS, [retry for retry in margin_retries if len(cages[retry[0]]) == 1]),
+        (_OCR_CONFIGS, [retry for retry in margin_retries if len(cages[retry[0]]) > 1]),
+    ):
+        for idx, reads in _read_retries(group, configs):
+            matched, raw_digits, is_zero_val, is_short_for_cage = doubts[idx]
+            for _, margin2, raw2 in reads:
+                m2 = _LABEL_RE.fullmatch(raw2)
                 if not m2:
                     continue
                 new_digits = m2.group(1)
                 # Accept if better: non-zero when was zero, or longer reading
                 improved = False
-                if not m_raw:
+                if not matched:
                     improved = True
                 elif is_zero_val and new_digits.lstrip("0") != "":
                     improved = True
                 elif is_short_for_cage and len(new_digits) > len(raw_digits):
                     improved = True
                 if improved:
-                    _dbg(f"  Retry with margin={margin2} improved: {raw!r} -> {raw2!r}")
-                    raw = raw2
+                    _dbg(f"  Retry with margin={margin2} improved: {raws[idx]!r} -> {raw2!r}")
+                    raws[idx] = raw2
                     break
-        m = _LABEL_RE.match(raw)
+
+    results: list[tuple[str, str | None]] = []
+    for cells, raw in zip(cages, raws):
+        if raw is None:
+            results.append(("?", None))
+            continue
+        single_cell = len(cells) == 1
+        m = _LABEL_RE.fullmatch(raw)
         if m:
-            results.append((m.group(1), m.group(2)))
+            # An operator read on a single-cell cage can only be noise
+            results.append((m.group(1), None if single_cell else m.group(2)))
         elif raw and raw[0].isdigit():
-            digits = re.match(r"[\d,]+", raw)
+            digits = _DIGITS_RE.match(raw)
             val = digits.group(0) if digits else raw
             rest = raw[len(val):]
-            op = rest[0] if rest and rest[0] in "+-x/?" else None
+            op = rest[0] if rest and rest[0] in "+-x/?" and not single_cell else None
             results.append((val, op))
         else:
             results.append(("?", None))
 
+    def _hires_crops(
+        idx: int, scales: tuple[int, ...], margins: tuple[int, ...],
+    ) -> list[tuple[int, int, np.ndarray]]:
+        """Upscaled label crops of cage idx from the original gray, in retry order.
+
+        Returns (scale, margin, crop) for each combination that fits in the
+        image.  A scale of 0 picks one that makes the crop about 80 px tall.
+        """
+        tl_r, tl_c = cages[idx][0]
+        cx_r, cy_r = v_pos[tl_c], h_pos[tl_r]
+        rw = int((v_pos[tl_c + 1] - cx_r) * 0.95)
+        rh = int((h_pos[tl_r + 1] - cy_r) * 0.45)
+        crops: list[tuple[int, int, np.ndarray]] = []
+        for scale in scales:
+            for m in margins:
+                rx = gx + cx_r + m
+                ry = gy + cy_r + m
+                crop_raw = gray[ry:ry + rh, rx:rx + rw]
+                if crop_raw.size == 0 or crop_raw.shape[0] < 5:
+                    continue
+                k = scale or max(3, 80 // crop_raw.shape[0])
+                crop_hi = cv2.resize(crop_raw, None, fx=k, fy=k,
+                                     interpolation=cv2.INTER_CUBIC)
+                crops.append((k, m, crop_hi))
+        return crops
+
     # Post-processing pass 1: retry short-value labels at higher upscale
     # from original gray to recover leading digits lost to border artifacts.
     # For small-cell grids (pre-upscaled), retry 2-digit values.
     # For all grids, retry 1-digit values in multi-cell cages (a single
     # digit like "8" is suspicious for a cage with 3+ cells and operation).
+    short_retries: list[tuple[int, list[tuple[int, int, np.ndarray]]]] = []
     for idx in range(len(results)):
         value, op = results[idx]
         if not value or value == "?":
@@ -1013,23 +1377,12 @@ def _read_cage_labels(
         is_small_cell_retry = grid_up is not None and len(value) == 2
         if not is_short_multicell and not is_small_cell_retry:
             continue
-        tl_r, tl_c = cages[idx][0]
-        cx_r, cy_r = v_pos[tl_c], h_pos[tl_r]
-        cw_r = v_pos[tl_c + 1] - cx_r
-        ch_r = h_pos[tl_r + 1] - cy_r
-        for retry_m in (3, 4):
-            rx = gx + cx_r + retry_m
-            ry = gy + cy_r + retry_m
-            rw = int(cw_r * 0.95)
-            rh = int(ch_r * 0.45)
-            crop_raw = gray[ry:ry + rh, rx:rx + rw]
-            if crop_raw.size == 0 or crop_raw.shape[0] < 5:
-                continue
-            scale = max(3, 80 // crop_raw.shape[0])
-            crop_hi = cv2.resize(crop_raw, None, fx=scale, fy=scale,
-                                 interpolation=cv2.INTER_CUBIC)
-            raw_hi = _ocr_crop(crop_hi)
-            m_hi = _LABEL_RE.match(raw_hi)
+        short_retries.append((idx, _hires_crops(idx, (0,), (3, 4))))
+
+    for idx, reads in _read_retries(short_retries):
+        value, op = results[idx]
+        for _, _, raw_hi in reads:
+            m_hi = _LABEL_RE.fullmatch(raw_hi)
             if m_hi and len(m_hi.group(1)) > len(value):
                 # Require original value as suffix in the longer result
                 # (prevents "7" → "10" but allows "8" → "108",
@@ -1048,12 +1401,18 @@ def _read_cage_labels(
 
     # Post-processing pass 2: enforce operators for multi-cell cages.
     # Only applies when the puzzle SHOWS operators (most cages already have one).
-    multi_cell_cages_with_operator = sum(1 for (_, op), c in zip(results, cages) if len(c) > 1 and op)
-    multi_cell_cages_without_operator = sum(1 for (_, op), c in zip(results, cages) if len(c) > 1 and not op)
+    multi_cell_cages_with_operator = multi_cell_cages_without_operator = 0
+    for (_, op), c in zip(results, cages):
+        if len(c) > 1:
+            if op:
+                multi_cell_cages_with_operator += 1
+            else:
+                multi_cell_cages_without_operator += 1
     has_operators = multi_cell_cages_with_operator > multi_cell_cages_without_operator
     if not has_operators:
         return results
 
+    op_retries: list[tuple[int, list[tuple[int, int, np.ndarray]]]] = []
     for idx in range(len(results)):
         value, op = results[idx]
         if len(cages[idx]) <= 1 or op is not None:
@@ -1068,52 +1427,54 @@ def _read_cage_labels(
             results[idx] = (value[:-1], "+")
             continue
 
+        # Strategy 2 is queued so that all its crops are OCR'd in one batch
+        op_retries.append((idx, _hires_crops(idx, (4, 6), (2, 3, 4))))
+
+    # Cages left for Strategy 3, with their isolated operator glyphs; their
+    # glyphs are OCR'd together in one batch after this loop
+    op_pending: list[tuple[int, np.ndarray, str | None]] = []
+    for idx, reads in _read_retries(op_retries):
+        value = results[idx][0]
+
         # Strategy 2: Retry with higher-resolution individual crop.
         # Extract from original gray at 4x/6x upscale for better operator detection.
-        tl_r, tl_c = cages[idx][0]
-        cx2, cy2 = v_pos[tl_c], h_pos[tl_r]
-        cw2 = v_pos[tl_c + 1] - cx2
-        ch2 = h_pos[tl_r + 1] - cy2
         found = False
-        for retry_scale in (4, 6):
-            for m2 in (2, 3, 4):
-                rx = gx + cx2 + m2
-                ry = gy + cy2 + m2
-                rw = int(cw2 * 0.95)
-                rh = int(ch2 * 0.45)
-                crop_raw = gray[ry:ry + rh, rx:rx + rw]
-                if crop_raw.size == 0 or crop_raw.shape[0] < 5:
+        for retry_scale, m2, raw_hi in reads:
+            m_hi = _LABEL_RE.fullmatch(raw_hi)
+            # Only accept if a real operator found (not '?')
+            if m_hi and m_hi.group(2) and m_hi.group(2) != "?":
+                # For short values, don't accept if digits changed
+                # (prevents '7' -> '1+' type misreads)
+                if len(value) <= 2 and m_hi.group(1) != value:
                     continue
-                crop_hi = cv2.resize(crop_raw, None, fx=retry_scale,
-                                     fy=retry_scale,
-                                     interpolation=cv2.INTER_CUBIC)
-                raw_hi = _ocr_crop(crop_hi)
-                m_hi = _LABEL_RE.match(raw_hi)
-                # Only accept if a real operator found (not '?')
-                if m_hi and m_hi.group(2) and m_hi.group(2) != "?":
-                    # For short values, don't accept if digits changed
-                    # (prevents '7' -> '1+' type misreads)
-                    if len(value) <= 2 and m_hi.group(1) != value:
-                        continue
-                    _dbg(f"    -> {raw_hi!r} (retry {retry_scale}x margin={m2})")
-                    results[idx] = (m_hi.group(1), m_hi.group(2))
-                    found = True
-                    break
-            if found:
+                _dbg(f"    -> {raw_hi!r} (retry {retry_scale}x margin={m2})")
+                results[idx] = (m_hi.group(1), m_hi.group(2))
+                found = True
                 break
         if found:
             continue
 
         # Strategy 3: Detect operator from rightmost connected component.
         # The operator sits to the right of digits; isolate and classify it.
+        tl_r, tl_c = cages[idx][0]
+        cx2, cy2 = v_pos[tl_c], h_pos[tl_r]
+        cw2 = v_pos[tl_c + 1] - cx2
+        ch2 = h_pos[tl_r + 1] - cy2
         crop_for_op = _extract_label_crop(
             gray, grid_up, gx, gy, upscale,
             cx2, cy2, cw2, ch2, margin=2,
         )
-        if crop_for_op is not None:
-            detected_op = _detect_trailing_operator(crop_for_op)
+        isolated = _isolate_trailing_operator(crop_for_op) if crop_for_op is not None else None
+        if isolated is not None:
+            op_pending.append((idx, *isolated))
+
+    if op_pending:
+        op_texts = _tesseract_texts_batch([glyph for _, glyph, _ in op_pending], _OP_CONFIGS)
+        for (idx, _, shape_op), texts in zip(op_pending, op_texts):
+            detected_op = _vote_operator(texts) or shape_op
             if detected_op:
-                _dbg(f"    -> {value}{detected_op} (component-based op detection)")
+                value = results[idx][0]
+                _dbg(f"  Cage {idx}: -> {value}{detected_op} (component-based op detection)")
                 results[idx] = (value, detected_op)
 
     # Post-processing pass 3: mathematical validation.
@@ -1123,46 +1484,33 @@ def _read_cage_labels(
     # digits lost to low-resolution OCR (e.g. "68x" → "288x" at 6×).
     # Fall back to heuristic corrections (digit substitutions, operator
     # swaps, extra-digit removal) only if the retry doesn't help.
+    invalid_retries: list[tuple[int, list[tuple[int, int, np.ndarray]]]] = []
     for idx in range(len(results)):
         value, op = results[idx]
         if not value or value == "?":
             continue
-        n_cells = len(cages[idx])
-        if _is_valid_cage_value(value, op, n_cells, n):
+        if _is_valid_cage_value(value, op, len(cages[idx]), n):
             continue
+        invalid_retries.append((idx, _hires_crops(idx, (4, 6, 8), (2, 3, 4))))
+
+    for idx, reads in _read_retries(invalid_retries):
+        value, op = results[idx]
+        n_cells = len(cages[idx])
 
         # Strategy A: re-read from original gray at high resolution.
-        tl_r, tl_c = cages[idx][0]
-        cx_r, cy_r = v_pos[tl_c], h_pos[tl_r]
-        cw_r = v_pos[tl_c + 1] - cx_r
-        ch_r = h_pos[tl_r + 1] - cy_r
         ocr_fixed = False
-        for retry_scale in (4, 6, 8):
-            for retry_margin in (2, 3, 4):
-                rx = gx + cx_r + retry_margin
-                ry = gy + cy_r + retry_margin
-                rw = int(cw_r * 0.95)
-                rh = int(ch_r * 0.45)
-                crop_raw = gray[ry:ry + rh, rx:rx + rw]
-                if crop_raw.size == 0 or crop_raw.shape[0] < 5:
-                    continue
-                crop_hi = cv2.resize(crop_raw, None, fx=retry_scale,
-                                     fy=retry_scale,
-                                     interpolation=cv2.INTER_CUBIC)
-                raw_hi = _ocr_crop(crop_hi)
-                m_hi = _LABEL_RE.match(raw_hi)
-                if not m_hi:
-                    continue
-                new_val = m_hi.group(1)
-                new_op = m_hi.group(2) or op
-                if _is_valid_cage_value(new_val, new_op, n_cells, n):
-                    _dbg(f"  Cage {idx}: hi-res retry {value}{op or ''}"
-                         f" -> {new_val}{new_op or ''}"
-                         f" (scale={retry_scale} margin={retry_margin})")
-                    results[idx] = (new_val, new_op)
-                    ocr_fixed = True
-                    break
-            if ocr_fixed:
+        for retry_scale, retry_margin, raw_hi in reads:
+            m_hi = _LABEL_RE.fullmatch(raw_hi)
+            if not m_hi:
+                continue
+            new_val = m_hi.group(1)
+            new_op = m_hi.group(2) or op
+            if _is_valid_cage_value(new_val, new_op, n_cells, n):
+                _dbg(f"  Cage {idx}: hi-res retry {value}{op or ''}"
+                     f" -> {new_val}{new_op or ''}"
+                     f" (scale={retry_scale} margin={retry_margin})")
+                results[idx] = (new_val, new_op)
+                ocr_fixed = True
                 break
 
         if ocr_fixed:
@@ -1189,6 +1537,8 @@ def ocr_mathdoku(
     if img is None:
         raise FileNotFoundError(f"Cannot read: {img_path}")
     gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    # Only the grayscale copy is used; free the 3-channel decode before OCR
+    del img
 
     # 1. Grid bounding box
     gx, gy, gw, gh = _find_grid_bbox(gray)
@@ -1253,8 +1603,11 @@ def main() -> None:
     out = path.with_suffix(".yaml")
     result = ocr_mathdoku(path)
 
-    with open(out, "w", encoding="utf-8") as f:
-        yaml.dump(result, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    out.write_text(
+        yaml.dump(result, Dumper=_YamlDumper, default_flow_style=False,
+                  allow_unicode=True, sort_keys=False),
+        encoding="utf-8",
+    )
     print(f"\nWrote {out}")
 
 
@@ -0,0 +1,26 @@
+"""Shared pytest configuration for the OCR tests."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--ocr-cache-dir",
+        default=None,
+        help="reuse OCR results stored in this directory "
+             "(keyed by image, OCR source hash, backend and Tesseract version)",
+    )
+
+
+@pytest.fixture(scope="session")
+def ocr_cache_dir(request: pytest.FixtureRequest) -> Path | None:
+    """Directory for cached OCR results, or None when caching is off (the default)."""
+    value = request.config.getoption("--ocr-cache-dir")
+    if value is None:
+        return None
+    path = Path(value)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
@@ -6,50 +6,82 @@ Run with: uv run pytest
 """
 from __future__ import annotations
 
+import functools
+import hashlib
 import pytest
+import subprocess
 from pathlib import Path
 
 import yaml
 
+from ocr import ocr_mathdoku as _ocr_module
 from ocr.ocr_mathdoku import ocr_mathdoku
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
+# Operator spellings that compare equal; anything else is kept as-is.
+_OP_NORMALIZE = {"\u2212": "-"}
+
+# Fixture image extensions, in order of preference
+_IMAGE_SUFFIXES = (".jpg", ".jpeg", ".png")
+
 
-def normalize_cage(cage: dict) -> tuple:
-    """Normalize a cage dict for comparison (sort cells, normalize op)."""
-    cells = tuple(sorted(cage.get("cells", [])))
-    value = cage.get("value")
+def _normalize_cage(cage: dict) -> tuple:
+    """Hashable form of one cage: sorted cells, value, normalized op."""
     op = cage.get("op")
-    # Normalize operator representation
-    if op in ("-", "−", "\u2212"):
-        op = "-"
-    return (cells, value, op)
+    return tuple(sorted(cage["cells"])), cage["value"], _OP_NORMALIZE.get(op, op)
 
 
-def normalize_cages(cages: list[dict]) -> set[tuple]:
-    """Normalize all cages for set comparison."""
-    return {normalize_cage(c) for c in cages}
+def normalize_cages(cages: list[dict]) -> frozenset[tuple]:
+    """Normalize all cages for set comparison (sort cells, normalize op)."""
+    try:
+        return frozenset(_normalize_cage(c) for c in cages)
+    except KeyError as e:
+        raise ValueError(f"Cage is missing required key {e}") from None
 
 
+@functools.lru_cache(maxsize=None)
 def load_expected(yaml_path: Path) -> dict:
-    """Load expected YAML and return normalized structure."""
-    with open(yaml_path, encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    """Load expected YAML (parsed once per path per session; treat as read-only)."""
+    return yaml.load(yaml_path.read_bytes(), Loader=_YamlLoader)
+
+
+@functools.lru_cache(maxsize=None)
+def load_expected_cages(yaml_path: Path) -> frozenset[tuple]:
+    """Normalized cages of an expected fixture (computed once per path)."""
+    return normalize_cages(load_expected(yaml_path).get("cages", []))
 
 
-def compare_puzzles(actual: dict, expected: dict) -> list[str]:
-    """Compare two puzzle dicts and return list of differences."""
+def compare_puzzles(
+    actual: dict,
+    expected: dict,
+    expected_cages: frozenset[tuple] | None = None,
+) -> list[str]:
+    """Compare two puzzle dicts and return list of differences.
+
+    ``expected_cages`` may carry the already-normalized expected cages to
+    avoid re-normalizing a fixture that never changes.
+    """
     errors = []
 
     # Compare size
     if actual.get("size") != expected.get("size"):
         errors.append(f"Size mismatch: got {actual.get('size')}, expected {expected.get('size')}")
+        # Cages of a differently sized grid cannot line up; skip the cage diff
+        return errors
 
     # Compare cages
     actual_cages = normalize_cages(actual.get("cages", []))
-    expected_cages = normalize_cages(expected.get("cages", []))
+    if expected_cages is None:
+        expected_cages = normalize_cages(expected.get("cages", []))
+    if actual_cages == expected_cages:
+        return errors
 
     missing = expected_cages - actual_cages
     extra = actual_cages - expected_cages
@@ -70,18 +102,84 @@ def discover_fixtures() -> list[tuple[str, Path, Path]]:
     if not FIXTURES_DIR.exists():
         return []
 
+    # One directory scan instead of probing each candidate image with exists()
+    yaml_files: list[Path] = []
+    images: dict[tuple[str, str], Path] = {}
+    for entry in FIXTURES_DIR.iterdir():
+        if entry.suffix == ".yaml":
+            yaml_files.append(entry)
+        elif entry.suffix in _IMAGE_SUFFIXES:
+            images[(entry.stem, entry.suffix)] = entry
+
     pairs = []
-    for yaml_file in sorted(FIXTURES_DIR.glob("*.yaml")):
+    for yaml_file in sorted(yaml_files):
         stem = yaml_file.stem
         # Look for matching image (jpg, jpeg, or png)
-        for ext in [".jpg", ".jpeg", ".png"]:
-            img_file = yaml_file.with_suffix(ext)
-            if img_file.exists():
+        for ext in _IMAGE_SUFFIXES:
+            img_file = images.get((stem, ext))
+            if img_file is not None:
                 pairs.append((stem, img_file, yaml_file))
                 break
     return pairs
 
 
+@functools.lru_cache(maxsize=None)
+def _ocr_source_digest() -> bytes:
+    """Hash of the OCR module source, so cached results expire when it changes."""
+    return hashlib.blake2b(Path(_ocr_module.__file__).read_bytes(), digest_size=16).digest()
+
+
+@functools.lru_cache(maxsize=None)
+def _ocr_backend_id() -> bytes:
+    """OCR backend and its Tesseract version, so switching either expires cached results."""
+    if _ocr_module.tesserocr is not None:
+        return f"tesserocr\n{_ocr_module.tesserocr.tesseract_version()}".encode()
+    proc = subprocess.run(
+        [_ocr_module.pytesseract.pytesseract.tesseract_cmd, "--version"],
+        capture_output=True, text=True,
+    )
+    return f"cli\n{proc.stdout}{proc.stderr}".encode()
+
+
+def run_ocr(img_path: Path, cache_dir: Path | None) -> dict:
+    """Run OCR on an image, reusing a cached result from cache_dir if one exists."""
+    if cache_dir is None:
+        return ocr_mathdoku(img_path)
+
+    h = hashlib.blake2b(img_path.read_bytes(), digest_size=16)
+    h.update(_ocr_source_digest())
+    h.update(_ocr_backend_id())
+    cache_file = cache_dir / f"{h.hexdigest()}.yaml"
+    if cache_file.exists():
+        with open(cache_file, encoding="utf-8") as f:
+            return yaml.load(f, Loader=_YamlLoader)
+
+    result = ocr_mathdoku(img_path)
+    with open(cache_file, "w", encoding="utf-8") as f:
+        yaml.dump(result, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    return result
+
+
+def format_cages(cages: list[dict]) -> str:
+    """Format cages one per line for a failure message."""
+    return "".join(
+        f"  {cells}: {value}{op}\n"
+        for cells, value, op in ((c["cells"], c["value"], c.get("op", "")) for c in cages)
+    )
+
+
+def format_failure(img_path: Path, errors: list[str], actual: dict, expected: dict) -> str:
+    """Build the detailed failure message; only called when a fixture fails."""
+    return "".join((
+        f"\nOCR errors for {img_path.name}:\n",
+        "\n".join(f"  - {e}" for e in errors),
+        "\n\nActual cages:\n",
+        format_cages(actual.get("cages", [])),
+        "\nExpected cages:\n",
+        format_cages(expected.get("cages", [])),
+    ))
+
+
 # Discover fixtures at module load time for parametrization
 FIXTURE_PAIRS = discover_fixtures()
 FIXTURE_IDS = [name for name, _, _ in FIXTURE_PAIRS]
@@ -92,33 +190,18 @@ FIXTURE_IDS = [name for name, _, _ in FIXTURE_PAIRS]
     FIXTURE_PAIRS,
     ids=FIXTURE_IDS,
 )
-def test_ocr_fixture(name: str, img_path: Path, yaml_path: Path):
+def test_ocr_fixture(name: str, img_path: Path, yaml_path: Path, ocr_cache_dir: Path | None):
     """Test OCR on a fixture image against expected YAML."""
     # Run OCR
-    actual = ocr_mathdoku(img_path)
+    actual = run_ocr(img_path, ocr_cache_dir)
 
     # Load expected
     expected = load_expected(yaml_path)
 
-    errors = compare_puzzles(actual, expected)
+    errors = compare_puzzles(actual, expected, load_expected_cages(yaml_path))
 
     if errors:
-        # Format detailed error message
-        msg = f"\nOCR errors for {img_path.name}:\n"
-        msg += "\n".join(f"  - {e}" for e in errors)
-        msg += f"\n\nActual cages:\n"
-        for cage in actual.get("cages", []):
-            cells = cage.get("cells", [])
-            value = cage.get("value")
-            op = cage.get("op", "")
-            msg += f"  {cells}: {value}{op}\n"
-        msg += f"\nExpected cages:\n"
-        for cage in expected.get("cages", []):
-            cells = cage.get("cells", [])
-            value = cage.get("value")
-            op = cage.get("op", "")
-            msg += f"  {cells}: {value}{op}\n"
-        pytest.fail(msg)
+        pytest.fail(format_failure(img_path, errors, actual, expected))
 
 
 if __name__ == "__main__":
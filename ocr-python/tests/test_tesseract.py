@@ -0,0 +1,147 @@
+"""
+Unit tests for the Tesseract plumbing behind label OCR.
+
+Most stub out the Tesseract process and run without a Tesseract install; the
+tesserocr comparison is skipped unless tesserocr and the Tesseract CLI are both
+installed (uv sync --extra tesserocr).
+Run with: uv run pytest tests/test_tesseract.py
+"""
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ocr import ocr_mathdoku as _ocr_module
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+_CONFIGS = ["--psm 7", "--psm 8"]
+
+
+def _page(cfg: str, image_path: str) -> str:
+    """Text the stubbed Tesseract reads from one image with one config."""
+    return f"{cfg}:{Path(image_path).stem}\n"
+
+
+def _stub_run_tesseract(
+    monkeypatch: pytest.MonkeyPatch, trailing_separator: bool, extra_page: bool = False,
+) -> None:
+    """Replace _run_tesseract with one that writes a page per image in the list file."""
+
+    def run(input_file: Path, out_base: Path, cfg: str) -> None:
+        pages = [_page(cfg, line) for line in input_file.read_text(encoding="utf-8").splitlines()]
+        if extra_page:
+            pages.append("stray\n")
+        text = "\f".join(pages) + ("\f" if trailing_separator else "")
+        out_base.with_suffix(".txt").write_text(text, encoding="utf-8")
+
+    monkeypatch.setattr(_ocr_module, "tesserocr", None)
+    monkeypatch.setattr(_ocr_module, "_run_tesseract", run)
+    # Two chunks of two and one of one, so pages must be mapped back across chunks
+    monkeypatch.setattr(_ocr_module, "_TESSERACT_BATCH_SIZE", 2)
+
+
+def _images(count: int) -> list[np.ndarray]:
+    return [np.full((20, 20), 255, dtype=np.uint8) for _ in range(count)]
+
+
+def _expected(count: int) -> list[list[str]]:
+    return [[_page(cfg, f"label_{i}") for cfg in _CONFIGS] for i in range(count)]
+
+
+@pytest.mark.parametrize("trailing_separator", [False, True], ids=["tesseract5", "tesseract4"])
+def test_batch_splits_pages(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], trailing_separator: bool,
+):
+    """Pages map back to their images, with or without an empty trailing page."""
+    _stub_run_tesseract(monkeypatch, trailing_separator)
+    monkeypatch.setattr(
+        _ocr_module, "_tesseract_texts", lambda *_: pytest.fail("unexpected per-image read"),
+    )
+
+    assert _ocr_module._tesseract_texts_batch(_images(5), _CONFIGS) == _expected(5)
+    assert capsys.readouterr().err == ""
+
+
+def test_batch_page_count_mismatch_falls_back(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str],
+):
+    """A page count that does not match warns on stderr and reads each image separately."""
+    _stub_run_tesseract(monkeypatch, trailing_separator=False, extra_page=True)
+    per_image: list[tuple[int, tuple[str, ...]]] = []
+
+    def read_one(padded: np.ndarray, configs: list[str]) -> list[str]:
+        per_image.append((id(padded), tuple(configs)))
+        return [f"single {configs[0]}"]
+
+    monkeypatch.setattr(_ocr_module, "_tesseract_texts", read_one)
+    images = _images(3)
+
+    texts = _ocr_module._tesseract_texts_batch(images, _CONFIGS)
+
+    assert texts == [[f"single {cfg}" for cfg in _CONFIGS] for _ in images]
+    # Every image is read on its own once per config
+    assert sorted(per_image) == sorted((id(img), (cfg,)) for img in images for cfg in _CONFIGS)
+    err = capsys.readouterr().err
+    # One warning per (chunk, config) run: chunks of 2 and 1 images, two configs each
+    assert err.count("Warning: batched Tesseract returned") == 4
+    assert "returned 3 pages for 2 images" in err
+    assert "returned 2 pages for 1 images" in err
+
+
+def test_parse_tesseract_config():
+    """CLI config strings split into the oem, psm and variables given to tesserocr."""
+    parse = _ocr_module._parse_tesseract_config
+    assert parse("--oem 1 --psm 7 -c tessedit_char_whitelist=0123456789+x-/,") == (
+        1, 7, {"tessedit_char_whitelist": "0123456789+x-/,"},
+    )
+    assert parse("--psm 10 -c tessedit_char_whitelist=0123456789") == (
+        3, 10, {"tessedit_char_whitelist": "0123456789"},
+    )
+    # Tesseract CLI defaults when a flag is absent
+    assert parse("--psm 8") == (3, 8, {})
+    assert parse("") == (3, 3, {})
+
+
+def _fixture_label_crops(
+    monkeypatch: pytest.MonkeyPatch, img_path: Path, per_kind: int,
+) -> list[tuple[np.ndarray, list[str]]]:
+    """Prepared label images, with their configs, from the first label reads of a fixture."""
+    batches: list[tuple[list[np.ndarray], list[str]]] = []
+
+    def record(images: list[np.ndarray], configs: list[str]) -> list[list[str]]:
+        batches.append((images, configs))
+        return [[] for _ in images]
+
+    with monkeypatch.context() as m:
+        m.setattr(_ocr_module, "_tesseract_texts_batch", record)
+        m.setattr(_ocr_module, "_require_tesseract", lambda: None)
+        _ocr_module.ocr_mathdoku(img_path)
+    # The first batch per config set is the first read: single-cell digits, then multi-cell labels
+    crops: list[tuple[np.ndarray, list[str]]] = []
+    for configs in (_ocr_module._DIGIT_CONFIGS, _ocr_module._OCR_CONFIGS):
+        images = next(images for images, batch_configs in batches if batch_configs is configs)
+        crops.extend((img, configs) for img in images[:per_kind])
+    return crops
+
+
+def test_tesserocr_matches_cli(monkeypatch: pytest.MonkeyPatch):
+    """The in-process tesserocr backend votes the same labels as the Tesseract CLI."""
+    tesserocr = pytest.importorskip("tesserocr")
+    pytesseract = _ocr_module.pytesseract
+    if pytesseract is None or not shutil.which(pytesseract.pytesseract.tesseract_cmd):
+        pytest.skip("Tesseract CLI not installed")
+
+    crops = _fixture_label_crops(monkeypatch, FIXTURES_DIR / "Blog04.png", per_kind=4)
+
+    def labels(backend: object) -> list[str]:
+        monkeypatch.setattr(_ocr_module, "tesserocr", backend)
+        return [
+            _ocr_module._pick_label(_ocr_module._tesseract_texts(img, configs))
+            for img, configs in crops
+        ]
+
+    assert labels(tesserocr) == labels(None)
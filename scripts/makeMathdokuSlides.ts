@@ -3,9 +3,12 @@
  *
  * Usage:
  *     npm run makeMathdokuSlides tests/fixtures/Blog15.yaml
+ *     npm run makeMathdokuSlides tests/fixtures/Blog15.yaml tests/fixtures/Blog16.yaml
+ *     npm run makeMathdokuSlides tests/fixtures/
  *
- * Creates a presentation named after the YAML file (e.g., "Blog15") in Google Drive,
- * binds the Apps Script solver, and opens the presentation URL.
+ * Creates a presentation named after each YAML file (e.g., "Blog15") in Google Drive,
+ * binds the Apps Script solver, and opens the presentation URL. Directories expand to
+ * the *.yaml files they contain; credentials are loaded once for the whole batch.
  *
  * First-time setup:
  *     1. Create a Google Cloud project and enable APIs (see README)
@@ -25,6 +28,7 @@ import {
   existsSync,
   readdirSync,
   readFileSync,
+  statSync,
   writeFileSync
 } from 'node:fs';
 import { createServer } from 'node:http';
@@ -46,6 +50,7 @@ enum HttpStatusCodes {
 
 const FIRST_CLI_ARG_INDEX = 2;
 const JSON_INDENT = 2;
+const MAX_CONCURRENT_BUILDS = 4;
 const OFF_SCREEN_COORDINATE = -10000;
 
 interface Cage {
@@ -63,6 +68,12 @@ interface CredentialsFile {
   };
 }
 
+interface PuzzleBuild {
+  name: string;
+  puzzleJson: PuzzleJson;
+  specPath: string;
+}
+
 interface PuzzleJson {
   cages: Cage[];
   hasOperators?: boolean;
@@ -110,8 +121,10 @@ const API_NAMES: Record<string, string> = {
 
 const ROOT = resolve(dirname(fileURLToPath(import.meta.url)), '..');
 const CREDENTIALS_FILE = join(ROOT, 'credentials.json');
+const DIST_DIR = resolve(ROOT, 'dist');
 const TEMPLATE_PPTX = join(ROOT, 'assets', 'template-960x540.pptx');
 const TOKEN_FILE = join(ROOT, 'token.json');
+const USAGE = 'Usage: npm run makeMathdokuSlides <puzzle.yaml | dir> [...]';
 
 const SCOPES = [
   'https://www.googleapis.com/auth/presentations',
@@ -121,7 +134,6 @@ const SCOPES = [
 
 async function bindAppsScript(auth: OAuth2Client, presId: string): Promise<string> {
   const scriptSvc = google.script({ auth, version: 'v1' });
-  const appsDir = resolve(ROOT, 'dist');
 
   const project = await scriptSvc.projects.create({
     requestBody: { parentId: presId, title: 'Mathdoku Solver' }
@@ -132,8 +144,8 @@ async function bindAppsScript(auth: OAuth2Client, presId: string): Promise<strin
   }
 
   const files: ScriptFile[] = [];
-  for (const entry of readdirSync(appsDir).sort()) {
-    const filePath = join(appsDir, entry);
+  for (const entry of readdirSync(DIST_DIR).sort()) {
+    const filePath = join(DIST_DIR, entry);
     if (entry.endsWith('.js')) {
       files.push({ name: entry.replace(/\.js$/, ''), source: readFileSync(filePath, 'utf-8'), type: 'SERVER_JS' });
     } else if (entry.endsWith('.html')) {
@@ -211,26 +223,17 @@ function buildPuzzleJson(spec: YamlSpec, name: string): PuzzleJson {
   return { cages, hasOperators, meta, puzzleSize: n, title };
 }
 
-async function buildSlides(specPath: string): Promise<string> {
-  const content = readFileSync(specPath, 'utf-8');
-  const spec = yaml.load(content);
-  if (typeof spec !== 'object' || spec === null) {
-    throw new Error('YAML spec must be a mapping');
-  }
-
-  const name = basename(specPath, '.yaml');
-  const puzzleJson = buildPuzzleJson(spec as YamlSpec, name);
-
-  const auth = await getCredentials();
+async function buildSlides(
+  auth: OAuth2Client,
+  { name, puzzleJson }: PuzzleBuild,
+  onCreated: (presId: string) => void
+): Promise<string> {
   const driveSvc = google.drive({ auth, version: 'v3' });
   const slidesSvc = google.slides({ auth, version: 'v1' });
 
   let presId: string;
   try {
     // 1. Upload PPTX template (960x540 pt) — presentations.create ignores pageSize
-    if (!existsSync(TEMPLATE_PPTX)) {
-      throw new Error(`Template not found: ${TEMPLATE_PPTX}`);
-    }
     const driveFile = await driveSvc.files.create({
       fields: 'id',
       media: {
@@ -246,17 +249,19 @@ async function buildSlides(specPath: string): Promise<string> {
       throw new Error('Drive file creation returned no id');
     }
     presId = driveFile.data.id;
+    onCreated(presId);
     console.log(`Created presentation: ${name} (${presId})`);
 
-    // 2. Bind Apps Script
-    await bindAppsScript(auth, presId);
-
-    // 3. Embed puzzle JSON in the first slide for Init menu to read
-    await embedPuzzleData(slidesSvc, presId, puzzleJson);
+    // 2. Bind Apps Script and 3. embed puzzle JSON in the first slide for Init menu to read.
+    // Both only depend on the presentation id, so issue them concurrently.
+    await Promise.all([
+      bindAppsScript(auth, presId),
+      embedPuzzleData(slidesSvc, presId, puzzleJson)
+    ]);
     console.log('Puzzle data embedded. Open the presentation and use Mathdoku > Init to complete setup.');
   } catch (error: unknown) {
     if ((error as GaxiosError).response !== undefined) {
-      handleHttpError(error as GaxiosError);
+      throw new Error(describeHttpError(error as GaxiosError), { cause: error });
     }
     throw error;
   }
@@ -267,6 +272,34 @@ async function buildSlides(specPath: string): Promise<string> {
   return url;
 }
 
+function describeHttpError(e: GaxiosError): string {
+  const status = e.response?.status ?? 0;
+  const errors = (e.response?.data as { error?: { details?: Record<string, unknown>[] } } | undefined)?.error?.details;
+  const detail = errors?.[0];
+  const reason = typeof detail?.['reason'] === 'string' ? detail['reason'] : '';
+
+  if (reason === 'SERVICE_DISABLED') {
+    const metadata = detail?.['metadata'] as Record<string, string> | undefined;
+    const service = metadata?.['service'] ?? '';
+    const friendly = API_NAMES[service] ?? service;
+    return `${friendly} is not enabled.\n`
+      + '\n'
+      + `  Run:  gcloud services enable ${service}\n`
+      + '\n'
+      + '  Then wait ~30 seconds and retry.';
+  }
+
+  if (reason === 'ACCESS_TOKEN_SCOPE_INSUFFICIENT' || status === (HttpStatusCodes.Forbidden as number)) {
+    return `permission denied: ${e.message}\n`
+      + '\n'
+      + `Full error details: ${JSON.stringify(e.response?.data, null, JSON_INDENT)}\n`
+      + '\n'
+      + `Delete ${TOKEN_FILE} and re-run to re-authenticate.`;
+  }
+
+  return `Google API request failed (${String(status)}): ${e.message}`;
+}
+
 async function getCredentials(): Promise<OAuth2Client> {
   const { clientId, clientSecret, redirectUri } = loadClientCredentials();
   const oauth2Client = new google.auth.OAuth2(clientId, clientSecret, redirectUri);
@@ -303,39 +336,8 @@ async function getCredentials(): Promise<OAuth2Client> {
   return interactiveAuth(clientId, clientSecret);
 }
 
-function handleHttpError(e: GaxiosError): never {
-  const status = e.response?.status ?? 0;
-  const errors = (e.response?.data as { error?: { details?: Record<string, unknown>[] } } | undefined)?.error?.details;
-  const detail = errors?.[0];
-  const reason = typeof detail?.['reason'] === 'string' ? detail['reason'] : '';
-
-  if (reason === 'SERVICE_DISABLED') {
-    const metadata = detail?.['metadata'] as Record<string, string> | undefined;
-    const service = metadata?.['service'] ?? '';
-    const friendly = API_NAMES[service] ?? service;
-    console.error(
-      `Error: ${friendly} is not enabled.\n`
-        + '\n'
-        + `  Run:  gcloud services enable ${service}\n`
-        + '\n'
-        + '  Then wait ~30 seconds and retry.'
-    );
-    process.exit(1);
-  }
-
-  if (reason === 'ACCESS_TOKEN_SCOPE_INSUFFICIENT' || status === (HttpStatusCodes.Forbidden as number)) {
-    console.error(
-      `Error: permission denied: ${e.message}\n`
-        + '\n'
-        + `Full error details: ${JSON.stringify(e.response?.data, null, JSON_INDENT)}\n`
-        + '\n'
-        + `Delete ${TOKEN_FILE} and re-run to re-authenticate.`
-    );
-    process.exit(1);
-  }
-
-  console.error(`Error: Google API request failed (${String(status)}): ${e.message}`);
-  process.exit(1);
+function getErrorMessage(error: unknown): string {
+  return error instanceof Error ? error.message : String(error);
 }
 
 async function interactiveAuth(clientId: string, clientSecret: string): Promise<OAuth2Client> {
@@ -413,17 +415,93 @@ function loadClientCredentials(): { clientId: string; clientSecret: string; redi
   };
 }
 
+function loadPuzzleBuild(specPath: string): PuzzleBuild {
+  const content = readFileSync(specPath, 'utf-8');
+  const spec = yaml.load(content);
+  if (typeof spec !== 'object' || spec === null) {
+    throw new Error('YAML spec must be a mapping');
+  }
+
+  const name = basename(specPath, '.yaml');
+  return { name, puzzleJson: buildPuzzleJson(spec as YamlSpec, name), specPath };
+}
+
 async function main(): Promise<void> {
-  const specPath = process.argv[FIRST_CLI_ARG_INDEX];
-  if (specPath === undefined) {
-    console.error('Usage: npm run makeMathdokuSlides <puzzle.yaml>');
+  const args = process.argv.slice(FIRST_CLI_ARG_INDEX);
+  if (args.length === 0) {
+    console.error(USAGE);
     process.exit(1);
   }
-  if (!existsSync(specPath)) {
-    console.error(`Error: ${specPath} not found`);
+
+  const specPaths: string[] = [];
+  for (const arg of args) {
+    if (!existsSync(arg)) {
+      console.error(`Error: ${arg} not found`);
+      process.exit(1);
+    }
+    if (statSync(arg).isDirectory()) {
+      for (const entry of readdirSync(arg).sort()) {
+        if (entry.endsWith('.yaml')) {
+          specPaths.push(join(arg, entry));
+        }
+      }
+    } else {
+      specPaths.push(arg);
+    }
+  }
+  if (specPaths.length === 0) {
+    console.error(`Error: no *.yaml files found in ${args.join(', ')}\n${USAGE}`);
     process.exit(1);
   }
-  await buildSlides(specPath);
+
+  // Parse every spec before touching Drive, so a bad one cannot leave half of a batch created.
+  const builds: PuzzleBuild[] = [];
+  const invalidSpecs: string[] = [];
+  for (const specPath of specPaths) {
+    try {
+      builds.push(loadPuzzleBuild(specPath));
+    } catch (error: unknown) {
+      invalidSpecs.push(`  ${specPath}: ${getErrorMessage(error)}`);
+    }
+  }
+  if (invalidSpecs.length > 0) {
+    console.error(`Error: invalid puzzle spec(s):\n${invalidSpecs.join('\n')}`);
+    process.exit(1);
+  }
+  if (!existsSync(TEMPLATE_PPTX)) {
+    console.error(`Error: template not found: ${TEMPLATE_PPTX}`);
+    process.exit(1);
+  }
+
+  // Each build is a chain of independent API round trips, so overlap a few of them.
+  // A failed build is recorded rather than thrown, so the other builds still run to completion.
+  const auth = await getCredentials();
+  const queue = [...builds];
+  const createdIds = new Map<string, string>();
+  const failures: { build: PuzzleBuild; error: unknown }[] = [];
+  const workers = Array.from({ length: Math.min(MAX_CONCURRENT_BUILDS, queue.length) }, async () => {
+    for (let build = queue.shift(); build !== undefined; build = queue.shift()) {
+      const { specPath } = build;
+      try {
+        await buildSlides(auth, build, (presId) => {
+          createdIds.set(specPath, presId);
+        });
+      } catch (error: unknown) {
+        failures.push({ build, error });
+      }
+    }
+  });
+  await Promise.allSettled(workers);
+
+  if (failures.length > 0) {
+    console.error(`\nError: ${String(failures.length)} of ${String(builds.length)} build(s) failed:`);
+    for (const { build: { specPath }, error } of failures) {
+      const presId = createdIds.get(specPath);
+      const created = presId === undefined ? '' : ` (presentation ${presId} was created but not completed)`;
+      console.error(`  ${specPath}${created}: ${getErrorMessage(error)}`);
+    }
+    process.exitCode = 1;
+  }
 }
 
 function openBrowser(url: string): void {
@@ -445,7 +523,8 @@ async function embedPuzzleData(
   presId: string,
   puzzleJson: PuzzleJson
 ): Promise<void> {
-  const pres = await slidesSvc.presentations.get({ presentationId: presId });
+  // Only the first slide id is needed; skip fetching the full page tree.
+  const pres = await slidesSvc.presentations.get({ fields: 'slides.objectId', presentationId: presId });
   const slideId = pres.data.slides?.[0]?.objectId;
   if (!slideId) {
     throw new Error('Presentation has no slides');
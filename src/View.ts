@@ -43,6 +43,7 @@ interface CandidatesProfile {
 
 interface GridRenderContext {
   readonly boundaries: GridBoundaries;
+  readonly cellWidth: number;
   readonly gridLeft: number;
   readonly gridSize: number;
   readonly gridTop: number;
@@ -51,6 +52,11 @@ interface GridRenderContext {
   readonly slide: GoogleAppsScript.Slides.Slide;
 }
 
+interface IdRun {
+  readonly endId: number;
+  readonly startId: number;
+}
+
 interface LayoutProfile {
   readonly axisFont: number;
   readonly axisLabelHeight: number;
@@ -202,6 +208,7 @@ export function importPuzzle(puzzleJson: PuzzleJson | string, presId?: string):
 
   const ctx: GridRenderContext = {
     boundaries,
+    cellWidth: gridSize / puzzleSize,
     gridLeft,
     gridSize,
     gridTop,
@@ -231,7 +238,6 @@ export function importPuzzle(puzzleJson: PuzzleJson | string, presId?: string):
   // Draw order
   drawThinGrid(ctx);
   drawCageBoundaries(ctx);
-  drawJoinSquares(ctx);
   drawOuterBorder(ctx);
   drawAxisLabels(ctx);
   drawCageLabels(ctx, cages, hasOperators);
@@ -242,9 +248,10 @@ export function importPuzzle(puzzleJson: PuzzleJson | string, presId?: string):
   const footerWidth = pt(SLIDE_WIDTH_PT - in2pt(SIDE_COUNT * TITLE_HORIZONTAL_MARGIN_INCHES));
   const footerHeight = pt(in2pt(FOOTER_HEIGHT_INCHES));
   const footerBox = slide.insertTextBox(FOOTER_TEXT, footerLeft, footerTop, footerWidth, footerHeight);
-  footerBox.getText().getTextStyle()
+  const footerRange = footerBox.getText();
+  footerRange.getTextStyle()
     .setFontFamily('Segoe UI').setFontSize(FOOTER_FONT_SIZE).setBold(false).setForegroundColor(FOOTER_COLOR);
-  footerBox.getText().getParagraphStyle().setParagraphAlignment(SlidesApp.ParagraphAlignment.END);
+  footerRange.getParagraphStyle().setParagraphAlignment(SlidesApp.ParagraphAlignment.END);
 
   // Solve notes columns
   renderSolveNotesColumns(ctx);
@@ -400,14 +407,14 @@ function applyPendingValue(
 
 function buildPuzzleFromSlide(): Puzzle {
   const state = getPuzzleState();
-  const slide = getCurrentSlide();
+  const elementsByTitle = indexPageElementsByTitle(getCurrentSlide());
   const values = new Map<string, number>();
   const candidates = new Map<string, Set<number>>();
 
   for (let rowId = 1; rowId <= state.puzzleSize; rowId++) {
     for (let columnId = 1; columnId <= state.puzzleSize; columnId++) {
       const ref = getCellRef(rowId, columnId);
-      readCellFromSlide(slide, ref, values, candidates);
+      readCellFromSlide(elementsByTitle, ref, values, candidates);
     }
   }
 
@@ -422,10 +429,6 @@ function buildPuzzleFromSlide(): Puzzle {
   });
 }
 
-function clamp(value: number, lo: number, hi: number): number {
-  return Math.max(lo, Math.min(hi, value));
-}
-
 function clearShapeText(slide: GoogleAppsScript.Slides.Slide, title: string): void {
   const shape = getShapeByTitle(slide, title);
   if (shape) {
@@ -444,8 +447,7 @@ function colorToHex(color: GoogleAppsScript.Slides.Color): string {
 }
 
 function drawAxisLabels(ctx: GridRenderContext): void {
-  const { gridLeft, gridTop, profile, puzzleSize, slide } = ctx;
-  const cellWidth = ctx.gridSize / puzzleSize;
+  const { cellWidth, gridLeft, gridTop, profile, puzzleSize, slide } = ctx;
   const axisFont = profile.axisFont;
   const labelHeight = pt(in2pt(profile.axisLabelHeight));
   const labelWidth = pt(in2pt(profile.axisLabelWidth));
@@ -453,14 +455,15 @@ function drawAxisLabels(ctx: GridRenderContext): void {
   const sideOffset = in2pt(profile.axisSideOffset);
   const topY = pt(gridTop - topOffset - TEXT_BOX_TOP_PADDING_PT);
   const sideX = pt(gridLeft - sideOffset);
+  const boxWidth = pt(cellWidth);
 
   let columnLeft = gridLeft;
   for (let columnId = 1; columnId <= puzzleSize; columnId++) {
-    const boxWidth = pt(cellWidth);
     const box = slide.insertTextBox(String.fromCharCode(CHAR_CODE_A + columnId - 1), pt(columnLeft), topY, boxWidth, labelHeight);
-    box.getText().getTextStyle()
+    const textRange = box.getText();
+    textRange.getTextStyle()
       .setFontFamily('Segoe UI').setFontSize(axisFont).setBold(true).setForegroundColor(AXIS_LABEL_MAGENTA);
-    box.getText().getParagraphStyle().setParagraphAlignment(SlidesApp.ParagraphAlignment.CENTER);
+    textRange.getParagraphStyle().setParagraphAlignment(SlidesApp.ParagraphAlignment.CENTER);
     box.getBorder().setTransparent();
     columnLeft += cellWidth;
   }
@@ -468,57 +471,34 @@ function drawAxisLabels(ctx: GridRenderContext): void {
   for (let rowId = 1; rowId <= puzzleSize; rowId++) {
     const y = pt(gridTop + (rowId - 1) * cellWidth + (cellWidth - labelHeight) / SIDE_COUNT);
     const box = slide.insertTextBox(String(rowId), sideX, y, labelWidth, labelHeight);
-    box.getText().getTextStyle()
+    const textRange = box.getText();
+    textRange.getTextStyle()
       .setFontFamily('Segoe UI').setFontSize(axisFont).setBold(true).setForegroundColor(AXIS_LABEL_MAGENTA);
-    box.getText().getParagraphStyle().setParagraphAlignment(SlidesApp.ParagraphAlignment.CENTER);
+    textRange.getParagraphStyle().setParagraphAlignment(SlidesApp.ParagraphAlignment.CENTER);
     box.setContentAlignment(SlidesApp.ContentAlignment.MIDDLE);
     box.getBorder().setTransparent();
   }
 }
 
 function drawCageBoundaries(ctx: GridRenderContext): void {
-  const { boundaries, gridLeft, gridSize, gridTop, profile, puzzleSize, slide } = ctx;
+  const { boundaries, cellWidth, gridLeft, gridTop, profile, puzzleSize, slide } = ctx;
   const thickPt = profile.thickPt;
-  const cellWidth = gridSize / puzzleSize;
   const inset = thickPt / SIDE_COUNT;
 
   for (let columnId = 1; columnId < puzzleSize; columnId++) {
-    let startRowId = 1;
-    while (startRowId <= puzzleSize) {
-      if (!boundaries.hasRightBound(startRowId, columnId)) {
-        startRowId++;
-        continue;
-      }
-      let endRowId = startRowId;
-      while (endRowId < puzzleSize && boundaries.hasRightBound(endRowId + 1, columnId)) {
-        endRowId++;
-      }
-      const x = gridLeft + columnId * cellWidth;
-      let y1 = gridTop + (startRowId - 1) * cellWidth;
-      let y2 = gridTop + endRowId * cellWidth;
-      if (startRowId === 1) {
-        y1 += inset;
-      }
-      if (endRowId === puzzleSize) {
-        y2 -= inset;
-      }
+    const x = gridLeft + columnId * cellWidth;
+    for (const { endId: endRowId, startId: startRowId } of findRuns(puzzleSize, (rowId) => boundaries.hasRightBound(rowId, columnId))) {
+      // Inset at the outer border. At interior vertices overshoot by half a stroke to fill the corner.
+      // A vertical run always ends at a horizontal boundary there, so no separate join square is needed.
+      const y1 = gridTop + (startRowId - 1) * cellWidth + (startRowId === 1 ? inset : -inset);
+      const y2 = gridTop + endRowId * cellWidth + (endRowId === puzzleSize ? -inset : inset);
       drawThickRect(slide, x - thickPt / SIDE_COUNT, y1, thickPt, y2 - y1);
-      startRowId = endRowId + 1;
     }
   }
 
   for (let rowId = 1; rowId < puzzleSize; rowId++) {
-    let startColumnId = 1;
-    while (startColumnId <= puzzleSize) {
-      if (!boundaries.hasBottomBound(rowId, startColumnId)) {
-        startColumnId++;
-        continue;
-      }
-      let endColumnId = startColumnId;
-      while (endColumnId < puzzleSize && boundaries.hasBottomBound(rowId, endColumnId + 1)) {
-        endColumnId++;
-      }
-      const y = gridTop + rowId * cellWidth;
+    const y = gridTop + rowId * cellWidth;
+    for (const { endId: endColumnId, startId: startColumnId } of findRuns(puzzleSize, (columnId) => boundaries.hasBottomBound(rowId, columnId))) {
       let x1 = gridLeft + (startColumnId - 1) * cellWidth;
       let x2 = gridLeft + endColumnId * cellWidth;
       if (startColumnId === 1) {
@@ -528,14 +508,12 @@ function drawCageBoundaries(ctx: GridRenderContext): void {
         x2 -= inset;
       }
       drawThickRect(slide, x1, y - thickPt / SIDE_COUNT, x2 - x1, thickPt);
-      startColumnId = endColumnId + 1;
     }
   }
 }
 
 function drawCageLabels(ctx: GridRenderContext, cages: readonly CageRaw[], hasOperators: boolean): void {
-  const { gridLeft, gridTop, profile, puzzleSize, slide } = ctx;
-  const cellWidth = ctx.gridSize / puzzleSize;
+  const { cellWidth, gridLeft, gridTop, profile, slide } = ctx;
   const cageProfile = profile.cage;
   const insetX = cageProfile.insetLeftFraction * cellWidth;
   const insetY = cageProfile.insetTopFraction * cellWidth;
@@ -544,13 +522,23 @@ function drawCageLabels(ctx: GridRenderContext, cages: readonly CageRaw[], hasOp
     cageProfile.boxHeightFraction * cellWidth,
     profile.candidates.topFraction * cellWidth - insetY
   );
+  // The text budget for fitFontSize is the same for every cage, so derive it once.
+  const usableHeight = Math.max(MIN_FONT_SIZE, labelBoxHeight - TEXT_BOX_TOP_PADDING_PT);
+  const maxLabelWidthPt = Math.max(1, labelBoxWidth - FONT_FIT_PADDING_PT);
+  const maxLabelHeightPt = Math.max(1, usableHeight - 1);
 
   for (let i = 0; i < cages.length; i++) {
     const cage = ensureNonNullable(cages[i]);
-    const parsed = cage.cells.map((ref) => ({ ref, ...parseCellRef(ref) }));
-    parsed.sort((a, b) => a.rowId === b.rowId ? a.columnId - b.columnId : a.rowId - b.rowId);
-    const topLeftCell = ensureNonNullable(parsed[0]);
-    const topLeftCellRef = topLeftCell.ref;
+    // Top-left = smallest row, then smallest column; a single scan instead of building and sorting a copy.
+    let topLeftCellRef = ensureNonNullable(cage.cells[0]);
+    let topLeftCell = parseCellRef(topLeftCellRef);
+    for (const ref of cage.cells) {
+      const cell = parseCellRef(ref);
+      if (cell.rowId < topLeftCell.rowId || (cell.rowId === topLeftCell.rowId && cell.columnId < topLeftCell.columnId)) {
+        topLeftCell = cell;
+        topLeftCellRef = ref;
+      }
+    }
 
     let label = cage.label ?? '';
     if (!label && cage.value !== undefined) {
@@ -561,48 +549,26 @@ function drawCageLabels(ctx: GridRenderContext, cages: readonly CageRaw[], hasOp
 
     const x = pt(gridLeft + (topLeftCell.columnId - 1) * cellWidth + insetX);
     const y = pt(gridTop + (topLeftCell.rowId - 1) * cellWidth + insetY - TEXT_BOX_TOP_PADDING_PT);
-    const usableHeight = Math.max(MIN_FONT_SIZE, labelBoxHeight - TEXT_BOX_TOP_PADDING_PT);
-    const actualFont = fitFontSize(label, cageProfile.font, labelBoxWidth / POINTS_PER_INCH, usableHeight / POINTS_PER_INCH);
+    const actualFont = fitFontSize(label, cageProfile.font, maxLabelWidthPt, maxLabelHeightPt);
     const box = slide.insertTextBox(label, x, y, pt(labelBoxWidth), pt(labelBoxHeight));
     box.setTitle(`CAGE_${String(i)}_${topLeftCellRef}`);
-    box.getText().getTextStyle()
+    const textRange = box.getText();
+    textRange.getTextStyle()
       .setFontFamily('Segoe UI').setFontSize(actualFont).setBold(true).setForegroundColor(CAGE_LABEL_BLUE);
-    box.getText().getParagraphStyle().setParagraphAlignment(SlidesApp.ParagraphAlignment.START);
+    textRange.getParagraphStyle().setParagraphAlignment(SlidesApp.ParagraphAlignment.START);
     box.setContentAlignment(SlidesApp.ContentAlignment.TOP);
   }
 }
 
-function drawJoinSquares(ctx: GridRenderContext): void {
-  const { boundaries, gridLeft, gridSize, gridTop, profile, puzzleSize, slide } = ctx;
-  const thickPt = profile.thickPt;
-  const cellWidth = gridSize / puzzleSize;
-
-  for (let vertexRow = 1; vertexRow < puzzleSize; vertexRow++) {
-    for (let vertexCol = 1; vertexCol < puzzleSize; vertexCol++) {
-      const verticalAbove = boundaries.hasRightBound(vertexRow, vertexCol);
-      const verticalBelow = boundaries.hasRightBound(vertexRow + 1, vertexCol);
-      const horizontalLeft = boundaries.hasBottomBound(vertexRow, vertexCol);
-      const horizontalRight = boundaries.hasBottomBound(vertexRow, vertexCol + 1);
-      if (!verticalAbove && !verticalBelow && !horizontalLeft && !horizontalRight) {
-        continue;
-      }
-      const x = gridLeft + vertexCol * cellWidth;
-      const y = gridTop + vertexRow * cellWidth;
-      const left = clamp(x - thickPt / SIDE_COUNT, gridLeft, gridLeft + gridSize - thickPt);
-      const top = clamp(y - thickPt / SIDE_COUNT, gridTop, gridTop + gridSize - thickPt);
-      drawThickRect(slide, left, top, pt(thickPt), pt(thickPt));
-    }
-  }
-}
-
 function drawOuterBorder(ctx: GridRenderContext): void {
   const { gridLeft, gridSize, gridTop, profile, slide } = ctx;
-  const thickPt = profile.thickPt;
-  const halfThick = thickPt / SIDE_COUNT;
-  drawThickRect(slide, gridLeft - halfThick, gridTop - halfThick, gridSize + thickPt, thickPt);
-  drawThickRect(slide, gridLeft - halfThick, gridTop + gridSize - halfThick, gridSize + thickPt, thickPt);
-  drawThickRect(slide, gridLeft - halfThick, gridTop + halfThick, thickPt, Math.max(0, gridSize - thickPt));
-  drawThickRect(slide, gridLeft + gridSize - halfThick, gridTop + halfThick, thickPt, Math.max(0, gridSize - thickPt));
+  // One unfilled square replaces four filled edge rectangles.
+  // Its border stroke is centered on the outline, so it still covers half a stroke on each side of the grid edge.
+  const rect = slide.insertShape(SlidesApp.ShapeType.RECTANGLE, pt(gridLeft), pt(gridTop), pt(gridSize), pt(gridSize));
+  rect.getFill().setTransparent();
+  const border = rect.getBorder();
+  border.getLineFill().setSolidFill(BLACK);
+  border.setWeight(profile.thickPt);
 }
 
 function drawThickRect(
@@ -623,31 +589,40 @@ function drawThickRect(
 }
 
 function drawThinGrid(ctx: GridRenderContext): void {
-  const { boundaries, gridLeft, gridSize, gridTop, profile, puzzleSize, slide } = ctx;
+  const { boundaries, cellWidth, gridLeft, gridTop, profile, puzzleSize, slide } = ctx;
   const thinWidth = profile.thinPt;
-  const cellWidth = gridSize / puzzleSize;
   const halfThinWidth = thinWidth / SIDE_COUNT;
 
-  for (let rowId = 1; rowId <= puzzleSize; rowId++) {
-    for (let columnId = 1; columnId <= puzzleSize; columnId++) {
-      const x = gridLeft + (columnId - 1) * cellWidth;
-      const y = gridTop + (rowId - 1) * cellWidth;
-
-      if (!boundaries.hasLeftBound(rowId, columnId)) {
-        const rect = slide.insertShape(SlidesApp.ShapeType.RECTANGLE, pt(x - halfThinWidth), pt(y), pt(thinWidth), pt(cellWidth));
-        rect.getFill().setSolidFill(THIN_GRAY);
-        rect.getBorder().setTransparent();
-      }
+  // One rectangle per maximal run of collinear in-cage cell edges rather than one per edge.
+  for (let columnId = 1; columnId < puzzleSize; columnId++) {
+    const x = gridLeft + columnId * cellWidth;
+    for (const { endId: endRowId, startId: startRowId } of findRuns(puzzleSize, (rowId) => !boundaries.hasRightBound(rowId, columnId))) {
+      const y = gridTop + (startRowId - 1) * cellWidth;
+      drawThinRect(slide, x - halfThinWidth, y, thinWidth, (endRowId - startRowId + 1) * cellWidth);
+    }
+  }
 
-      if (!boundaries.hasTopBound(rowId, columnId)) {
-        const rect = slide.insertShape(SlidesApp.ShapeType.RECTANGLE, pt(x), pt(y - halfThinWidth), pt(cellWidth), pt(thinWidth));
-        rect.getFill().setSolidFill(THIN_GRAY);
-        rect.getBorder().setTransparent();
-      }
+  for (let rowId = 1; rowId < puzzleSize; rowId++) {
+    const y = gridTop + rowId * cellWidth;
+    for (const { endId: endColumnId, startId: startColumnId } of findRuns(puzzleSize, (columnId) => !boundaries.hasBottomBound(rowId, columnId))) {
+      const x = gridLeft + (startColumnId - 1) * cellWidth;
+      drawThinRect(slide, x, y - halfThinWidth, (endColumnId - startColumnId + 1) * cellWidth, thinWidth);
     }
   }
 }
 
+function drawThinRect(
+  slide: GoogleAppsScript.Slides.Slide,
+  left: number,
+  top: number,
+  width: number,
+  height: number
+): void {
+  const rect = slide.insertShape(SlidesApp.ShapeType.RECTANGLE, pt(left), pt(top), pt(width), pt(height));
+  rect.getFill().setSolidFill(THIN_GRAY);
+  rect.getBorder().setTransparent();
+}
+
 function ensureLastSlideSelected(): boolean {
   const pres = SlidesApp.getActivePresentation();
   const slides = pres.getSlides();
@@ -742,14 +717,35 @@ function finalizeValueShape(shape: GoogleAppsScript.Slides.Shape): void {
   }
 }
 
-function fitFontSize(text: string, basePt: number, boxWidthIn: number, boxHeightIn: number): number {
-  const trimmedText = text.trim();
-  if (!trimmedText) {
+// Collapses consecutive ids (1..puzzleSize) where isInRun holds into inclusive runs.
+function findRuns(puzzleSize: number, isInRun: (id: number) => boolean): IdRun[] {
+  const runs: IdRun[] = [];
+  let startId = 0;
+  for (let id = 1; id <= puzzleSize; id++) {
+    if (isInRun(id)) {
+      if (startId === 0) {
+        startId = id;
+      }
+    } else if (startId !== 0) {
+      runs.push({ endId: id - 1, startId });
+      startId = 0;
+    }
+  }
+  if (startId !== 0) {
+    runs.push({ endId: puzzleSize, startId });
+  }
+  return runs;
+}
+
+function fitFontSize(text: string, basePt: number, maxWidthPt: number, maxHeightPt: number): number {
+  const charCount = text.trim().length;
+  if (charCount === 0) {
+    return basePt;
+  }
+  // Common case: short labels fit at the base size, so skip the floor/min chain.
+  if (basePt >= MIN_FONT_SIZE && basePt * FONT_FIT_WIDTH_RATIO * charCount <= maxWidthPt && basePt * FONT_FIT_HEIGHT_RATIO <= maxHeightPt) {
     return basePt;
   }
-  const maxWidthPt = Math.max(1, boxWidthIn * POINTS_PER_INCH - FONT_FIT_PADDING_PT);
-  const maxHeightPt = Math.max(1, boxHeightIn * POINTS_PER_INCH - 1);
-  const charCount = Math.max(1, trimmedText.length);
   const widthBased = Math.floor(maxWidthPt / (FONT_FIT_WIDTH_RATIO * charCount));
   const heightBased = Math.floor(maxHeightPt / FONT_FIT_HEIGHT_RATIO);
   return Math.max(MIN_FONT_SIZE, Math.min(basePt, widthBased, heightBased));
@@ -811,6 +807,19 @@ function in2pt(inches: number): number {
   return inches * POINTS_PER_INCH;
 }
 
+// Reading a whole slide looks up two titled shapes per cell; index them once instead of scanning per lookup.
+function indexPageElementsByTitle(slide: GoogleAppsScript.Slides.Slide): Map<string, GoogleAppsScript.Slides.PageElement> {
+  const elementsByTitle = new Map<string, GoogleAppsScript.Slides.PageElement>();
+  for (const el of slide.getPageElements()) {
+    const title = el.getTitle();
+    // Keep the first match, like getShapeByTitle.
+    if (title && !elementsByTitle.has(title)) {
+      elementsByTitle.set(title, el);
+    }
+  }
+  return elementsByTitle;
+}
+
 function isColorEqual(color: GoogleAppsScript.Slides.Color, hex: string): boolean {
   return colorToHex(color) === hex.toUpperCase();
 }
@@ -843,17 +852,8 @@ function makeNextSlide(puzzleSize: number, noteText = ''): void {
 }
 
 function opSymbol(op: string): string {
-  const map: Record<string, string> = {
-    '-': '\u2212',
-    '*': 'x',
-    '/': '/',
-    '+': '+',
-    '\u00f7': '/',
-    '\u2212': '\u2212',
-    'X': 'x',
-    'x': 'x'
-  };
-  return map[op.trim()] ?? op.trim();
+  const trimmedOp = op.trim();
+  return OP_SYMBOLS[trimmedOp] ?? trimmedOp;
 }
 
 function pt(x: number): number {
@@ -861,12 +861,12 @@ function pt(x: number): number {
 }
 
 function readCellFromSlide(
-  slide: GoogleAppsScript.Slides.Slide,
+  elementsByTitle: ReadonlyMap<string, GoogleAppsScript.Slides.PageElement>,
   ref: string,
   values: Map<string, number>,
   candidates: Map<string, Set<number>>
 ): void {
-  const valueShape = getShapeByTitle(slide, `VALUE_${ref}`);
+  const valueShape = elementsByTitle.get(`VALUE_${ref}`)?.asShape();
   if (valueShape) {
     const text = valueShape.getText().asString().replace(/\n$/, '').trim();
     if (/^[1-9]$/.test(text)) {
@@ -874,7 +874,7 @@ function readCellFromSlide(
     }
   }
 
-  const candShape = getShapeByTitle(slide, `CANDIDATES_${ref}`);
+  const candShape = elementsByTitle.get(`CANDIDATES_${ref}`)?.asShape();
   if (!candShape) {
     return;
   }
@@ -911,52 +911,82 @@ function renderSolveNotesColumns(ctx: GridRenderContext): void {
   for (let i = 0; i < solveProfile.columnCount; i++) {
     const noteBox = slide.insertTextBox(' ', pt(notesLeft + i * (columnWidth + columnGap)), pt(gridTop), pt(columnWidth), pt(gridSize));
     noteBox.setTitle(`SOLVE_NOTES_COL${String(i + 1)}`);
-    noteBox.getText().getTextStyle()
+    const textRange = noteBox.getText();
+    textRange.getTextStyle()
       .setFontFamily('Segoe UI').setFontSize(solveProfile.font).setBold(false).setForegroundColor(VALUE_GRAY);
-    noteBox.getText().getParagraphStyle().setParagraphAlignment(SlidesApp.ParagraphAlignment.START);
+    textRange.getParagraphStyle().setParagraphAlignment(SlidesApp.ParagraphAlignment.START);
     noteBox.setContentAlignment(SlidesApp.ContentAlignment.TOP);
-    noteBox.getBorder().getLineFill().setSolidFill(LIGHT_GRAY_BORDER);
-    noteBox.getBorder().setWeight(1);
+    const border = noteBox.getBorder();
+    border.getLineFill().setSolidFill(LIGHT_GRAY_BORDER);
+    border.setWeight(1);
   }
 }
 
 function renderValueAndCandidateBoxes(ctx: GridRenderContext): void {
-  const { gridLeft, gridTop, profile, puzzleSize, slide } = ctx;
-  const cellWidth = ctx.gridSize / puzzleSize;
+  const { cellWidth, gridLeft, gridTop, profile, puzzleSize, slide } = ctx;
   const valueProfile = profile.value;
   const candidatesProfile = profile.candidates;
 
+  // Style one value box and one candidates box, then duplicate them for the remaining cells.
+  // Calling duplicate() carries over text and paragraph styles, so each extra cell costs only a move and a rename.
+  // Copies may stack differently than per-cell inserts did; shapes are only ever looked up by title.
+  // Either way, each cell's candidates box is created after its value box and so still sits above it.
+  const valueTemplate = slide.insertTextBox(
+    ' ',
+    pt(gridLeft),
+    pt(gridTop + valueProfile.topFraction * cellWidth),
+    pt(cellWidth),
+    pt(valueProfile.heightFraction * cellWidth)
+  );
+  const valueTemplateText = valueTemplate.getText();
+  valueTemplateText.getTextStyle()
+    .setFontFamily('Segoe UI').setFontSize(valueProfile.font).setBold(true).setForegroundColor(VALUE_GRAY);
+  valueTemplateText.getParagraphStyle().setParagraphAlignment(SlidesApp.ParagraphAlignment.CENTER);
+  valueTemplate.setContentAlignment(SlidesApp.ContentAlignment.MIDDLE);
+
+  const candidatesTemplate = slide.insertTextBox(
+    ' ',
+    pt(gridLeft + candidatesProfile.leftFraction * cellWidth),
+    pt(gridTop + candidatesProfile.topFraction * cellWidth),
+    pt(candidatesProfile.widthFraction * cellWidth),
+    pt(candidatesProfile.heightFraction * cellWidth + SIDE_COUNT * TEXT_BOX_TOP_PADDING_PT)
+  );
+  const candidatesTemplateText = candidatesTemplate.getText();
+  candidatesTemplateText.getTextStyle()
+    .setFontFamily(CANDIDATES_FONT).setFontSize(candidatesProfile.font).setBold(false).setForegroundColor(CANDIDATES_DARK_RED);
+  candidatesTemplateText.getParagraphStyle().setParagraphAlignment(SlidesApp.ParagraphAlignment.START);
+  candidatesTemplate.setContentAlignment(SlidesApp.ContentAlignment.BOTTOM);
+
+  // Box lefts depend only on the column and tops only on the row, so compute each once instead of per cell.
+  const valueLefts: number[] = [];
+  const candidatesLefts: number[] = [];
+  for (let columnId = 1; columnId <= puzzleSize; columnId++) {
+    const cellLeft = gridLeft + (columnId - 1) * cellWidth;
+    valueLefts.push(pt(cellLeft));
+    candidatesLefts.push(pt(cellLeft + candidatesProfile.leftFraction * cellWidth));
+  }
+
   for (let rowId = 1; rowId <= puzzleSize; rowId++) {
+    const cellTop = gridTop + (rowId - 1) * cellWidth;
+    const valueTop = pt(cellTop + valueProfile.topFraction * cellWidth);
+    const candidatesTop = pt(cellTop + candidatesProfile.topFraction * cellWidth);
     for (let columnId = 1; columnId <= puzzleSize; columnId++) {
-      const cellLeft = gridLeft + (columnId - 1) * cellWidth;
-      const cellTop = gridTop + (rowId - 1) * cellWidth;
       const ref = getCellRef(rowId, columnId);
+      const isTemplateCell = rowId === 1 && columnId === 1;
 
-      const valueBox = slide.insertTextBox(
-        ' ',
-        pt(cellLeft),
-        pt(cellTop + valueProfile.topFraction * cellWidth),
-        pt(cellWidth),
-        pt(valueProfile.heightFraction * cellWidth)
-      );
+      const valueBox = isTemplateCell
+        ? valueTemplate
+        : valueTemplate.duplicate()
+          .setLeft(ensureNonNullable(valueLefts[columnId - 1]))
+          .setTop(valueTop);
       valueBox.setTitle(`VALUE_${ref}`);
-      valueBox.getText().getTextStyle()
-        .setFontFamily('Segoe UI').setFontSize(valueProfile.font).setBold(true).setForegroundColor(VALUE_GRAY);
-      valueBox.getText().getParagraphStyle().setParagraphAlignment(SlidesApp.ParagraphAlignment.CENTER);
-      valueBox.setContentAlignment(SlidesApp.ContentAlignment.MIDDLE);
-
-      const candidatesBox = slide.insertTextBox(
-        ' ',
-        pt(cellLeft + candidatesProfile.leftFraction * cellWidth),
-        pt(cellTop + candidatesProfile.topFraction * cellWidth),
-        pt(candidatesProfile.widthFraction * cellWidth),
-        pt(candidatesProfile.heightFraction * cellWidth + SIDE_COUNT * TEXT_BOX_TOP_PADDING_PT)
-      );
+
+      const candidatesBox = isTemplateCell
+        ? candidatesTemplate
+        : candidatesTemplate.duplicate()
+          .setLeft(ensureNonNullable(candidatesLefts[columnId - 1]))
+          .setTop(candidatesTop);
       candidatesBox.setTitle(`CANDIDATES_${ref}`);
-      candidatesBox.getText().getTextStyle()
-        .setFontFamily(CANDIDATES_FONT).setFontSize(candidatesProfile.font).setBold(false).setForegroundColor(CANDIDATES_DARK_RED);
-      candidatesBox.getText().getParagraphStyle().setParagraphAlignment(SlidesApp.ParagraphAlignment.START);
-      candidatesBox.setContentAlignment(SlidesApp.ContentAlignment.BOTTOM);
     }
   }
 }
@@ -994,16 +1024,18 @@ function scaleSlideElements(slide: GoogleAppsScript.Slides.Slide, scale: number)
       const shape = element.asShape();
       try {
         for (const run of shape.getText().getRuns()) {
-          const fontSize = run.getTextStyle().getFontSize();
+          const style = run.getTextStyle();
+          const fontSize = style.getFontSize();
           if (fontSize) {
-            run.getTextStyle().setFontSize(Math.max(MIN_FONT_SIZE, Math.round(fontSize * scale)));
+            style.setFontSize(Math.max(MIN_FONT_SIZE, Math.round(fontSize * scale)));
           }
         }
       } catch { /* GetText throws on shapes without text (e.g. grid rectangles) */ }
       try {
-        const borderWeight = shape.getBorder().getWeight();
+        const border = shape.getBorder();
+        const borderWeight = border.getWeight();
         if (borderWeight > 0) {
-          shape.getBorder().setWeight(borderWeight * scale);
+          border.setWeight(borderWeight * scale);
         }
       } catch { /* GetBorder may throw when no border is set */ }
     } else if (type === SlidesApp.PageElementType.LINE) {
@@ -1163,6 +1195,16 @@ const LAYOUT_PROFILES: Record<number, LayoutProfile> = {
 /* eslint-enable no-magic-numbers -- End layout profiles. */
 const LIGHT_GRAY_BORDER = '#C8C8C8';
 const MIN_FONT_SIZE = 7;
+const OP_SYMBOLS: Record<string, string> = {
+  '-': '\u2212',
+  '*': 'x',
+  '/': '/',
+  '+': '+',
+  '\u00f7': '/',
+  '\u2212': '\u2212',
+  'X': 'x',
+  'x': 'x'
+};
 const POINTS_PER_INCH = 72;
 const PUZZLE_INIT_OBJECT_ID = 'PuzzleInitData';
 const SCALE_MARGIN_PT = 20;
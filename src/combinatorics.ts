@@ -4,71 +4,78 @@ import { getCellRef } from './parsers.ts';
 import { ensureNonNullable } from './typeGuards.ts';
 
 const BINARY_OP_SIZE = 2;
-const FIRST_INNER_BOUNDARY_ID = 2;
 
 export class GridBoundaries {
-  private readonly horizontalBounds: boolean[][];
+  // Flat row-major flags for inner edges only: horizontalBounds holds each cell's bottom edge
+  // (puzzleSize per row), verticalBounds each cell's right edge (puzzleSize - 1 per row).
+  private readonly horizontalBounds: Uint8Array;
   private readonly puzzleSize: number;
-  private readonly verticalBounds: boolean[][];
+  private readonly verticalBounds: Uint8Array;
 
   public constructor(cages: readonly CageRaw[], puzzleSize: number) {
     this.puzzleSize = puzzleSize;
 
-    const cellToCage: Record<string, number> = {};
+    // Cells are matched by their exact in-grid ref, so a malformed, out-of-grid or non-canonical ref
+    // (e.g. 'b2') marks no cell rather than throwing.
+    const cellIndexByRef = new Map<string, number>();
+    for (let rowId = 1; rowId <= puzzleSize; rowId++) {
+      for (let columnId = 1; columnId <= puzzleSize; columnId++) {
+        cellIndexByRef.set(getCellRef(rowId, columnId), (rowId - 1) * puzzleSize + columnId - 1);
+      }
+    }
+
+    // Cage id per cell in row-major order; 0 marks cells not covered by any cage.
+    const cageIds = new Int32Array(puzzleSize * puzzleSize);
     for (let cageId = 1; cageId <= cages.length; cageId++) {
       const cage = ensureNonNullable(cages[cageId - 1]);
       for (const cell of cage.cells) {
-        cellToCage[cell] = cageId;
+        const cellIndex = cellIndexByRef.get(cell);
+        if (cellIndex !== undefined) {
+          cageIds[cellIndex] = cageId;
+        }
       }
     }
 
-    const verticalBounds: boolean[][] = [];
-    const horizontalBounds: boolean[][] = [];
+    const innerCount = puzzleSize - 1;
+    this.verticalBounds = new Uint8Array(puzzleSize * innerCount);
+    this.horizontalBounds = new Uint8Array(innerCount * puzzleSize);
     for (let rowId = 1; rowId <= puzzleSize; rowId++) {
-      const row: boolean[] = [];
-      verticalBounds[rowId - 1] = row;
-      for (let columnId = FIRST_INNER_BOUNDARY_ID; columnId <= puzzleSize; columnId++) {
-        row[columnId - FIRST_INNER_BOUNDARY_ID] = cellToCage[getCellRef(rowId, columnId - 1)] !== cellToCage[getCellRef(rowId, columnId)];
-      }
-    }
-    for (let rowId = FIRST_INNER_BOUNDARY_ID; rowId <= puzzleSize; rowId++) {
-      const row: boolean[] = [];
-      horizontalBounds[rowId - FIRST_INNER_BOUNDARY_ID] = row;
+      const rowStart = (rowId - 1) * puzzleSize;
       for (let columnId = 1; columnId <= puzzleSize; columnId++) {
-        row[columnId - 1] = cellToCage[getCellRef(rowId - 1, columnId)] !== cellToCage[getCellRef(rowId, columnId)];
+        const cellIndex = rowStart + columnId - 1;
+        if (columnId < puzzleSize && cageIds[cellIndex] !== cageIds[cellIndex + 1]) {
+          this.verticalBounds[(rowId - 1) * innerCount + columnId - 1] = 1;
+        }
+        if (rowId < puzzleSize && cageIds[cellIndex] !== cageIds[cellIndex + puzzleSize]) {
+          this.horizontalBounds[cellIndex] = 1;
+        }
       }
     }
-
-    this.verticalBounds = verticalBounds;
-    this.horizontalBounds = horizontalBounds;
   }
 
   public hasBottomBound(rowId: number, columnId: number): boolean {
     if (rowId >= this.puzzleSize) {
       return true;
     }
-    return ensureNonNullable(ensureNonNullable(this.horizontalBounds[rowId - 1])[columnId - 1]);
+    return this.horizontalBounds[(rowId - 1) * this.puzzleSize + columnId - 1] === 1;
   }
 
   public hasLeftBound(rowId: number, columnId: number): boolean {
-    if (columnId <= 1) {
-      return true;
-    }
-    return ensureNonNullable(ensureNonNullable(this.verticalBounds[rowId - 1])[columnId - FIRST_INNER_BOUNDARY_ID]);
+    return this.hasRightBound(rowId, columnId - 1);
   }
 
   public hasRightBound(rowId: number, columnId: number): boolean {
-    if (columnId >= this.puzzleSize) {
+    if (columnId <= 0 || columnId >= this.puzzleSize) {
       return true;
     }
-    return ensureNonNullable(ensureNonNullable(this.verticalBounds[rowId - 1])[columnId - 1]);
+    return this.verticalBounds[(rowId - 1) * (this.puzzleSize - 1) + columnId - 1] === 1;
   }
 
   public hasTopBound(rowId: number, columnId: number): boolean {
     if (rowId <= 1) {
       return true;
     }
-    return ensureNonNullable(ensureNonNullable(this.horizontalBounds[rowId - FIRST_INNER_BOUNDARY_ID])[columnId - 1]);
+    return this.hasBottomBound(rowId - 1, columnId);
   }
 }
 
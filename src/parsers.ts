@@ -1,5 +1,3 @@
-import { ensureNonNullable } from './typeGuards.ts';
-
 export type CellOperation = CandidatesOperation | ClearanceOperation | StrikethroughOperation | ValueOperation;
 
 export interface CellRef {
@@ -26,22 +24,46 @@ interface ValueOperation {
   readonly value: number;
 }
 
+// The same handful of refs is parsed over and over (cage cells, boundaries, labels, strategies).
+// Entries are keyed by the normalized ref.
+// Only refs that fit a square grid with lettered columns are cached, capping it at MAX_GRID_SIZE^2 entries.
+const CELL_REF_CACHE = new Map<string, CellRef>();
 const CHAR_CODE_A = 65;
+const CHAR_CODE_Z = 90;
+const CHAR_CODE_ZERO = 48;
+const DECIMAL_RADIX = 10;
+const MAX_GRID_SIZE = CHAR_CODE_Z - CHAR_CODE_A + 1;
 
 export function getCellRef(rowId: number, columnId: number): string {
   return String.fromCharCode(CHAR_CODE_A + columnId - 1) + String(rowId);
 }
 
 export function parseCellRef(token: string): CellRef {
-  const m = /^(?<col>[A-Z])(?<row>[1-9]\d*)$/.exec(token.trim().toUpperCase());
-  if (!m) {
+  const ref = token.trim().toUpperCase();
+  const cached = CELL_REF_CACHE.get(ref);
+  if (cached) {
+    return cached;
+  }
+  // Hand-rolled equivalent of /^[A-Z][1-9]\d*$/ — this runs for every cage cell, so skip the regex engine.
+  const columnCode = ref.charCodeAt(0);
+  let isValid = ref.length > 1 && columnCode >= CHAR_CODE_A && columnCode <= CHAR_CODE_Z && ref.charAt(1) !== '0';
+  let rowId = 0;
+  for (let i = 1; isValid && i < ref.length; i++) {
+    const digit = ref.charCodeAt(i) - CHAR_CODE_ZERO;
+    isValid = digit >= 0 && digit < DECIMAL_RADIX;
+    rowId = rowId * DECIMAL_RADIX + digit;
+  }
+  if (!isValid) {
     throw new Error(`Bad cell ref: ${token}`);
   }
-  const groups = ensureNonNullable(m.groups);
-  return {
-    columnId: ensureNonNullable(groups['col']).charCodeAt(0) - CHAR_CODE_A + 1,
-    rowId: parseInt(ensureNonNullable(groups['row']), 10)
+  const cellRef: CellRef = {
+    columnId: columnCode - CHAR_CODE_A + 1,
+    rowId
   };
+  if (rowId <= MAX_GRID_SIZE) {
+    CELL_REF_CACHE.set(ref, cellRef);
+  }
+  return cellRef;
 }
 
 export function parseOperation(text: string, cellCount: number): CellOperation {